@@ -1,141 +1,289 @@
 """Streamlit app for the UI to query the RAG with chat interface"""
 
 import logging
+import os
 import sys
-import time
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from queue import Empty, Queue
+from itertools import chain
+from queue import Empty, Queue, SimpleQueue
+from typing import Any, Final
 
 import streamlit as st
-import torch
 from flyde.flow import Flow
-from flyde.io import EOF
+from flyde.io import EOF, is_EOF
+
+from swlwi.protocol import END_OF_RESPONSE
 
 # =============================================================================
 # CONFIGURATION & SETUP
 # =============================================================================
 
-# Configure logging to show in console (avoid duplicates)
-if not logging.getLogger().handlers:
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        stream=sys.stdout,
-    )
-else:
-    # If already configured, just set the level
-    logging.getLogger().setLevel(logging.INFO)
 
-# Fix streamlit torch classes path warning
-torch.classes.__path__ = []  # type: ignore
+@st.cache_resource(show_spinner=False)
+def configure_logging():
+    """Configure logging to show in console once per process rather than on every rerun."""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            stream=sys.stdout,
+        )
+    else:
+        # If already configured, just set the level
+        logging.getLogger().setLevel(logging.INFO)
+
+
+configure_logging()
 
 # Page config
 st.set_page_config(page_title="SWLWI Knowledge Base", page_icon="🚀", layout="wide")
 
+# Chat message avatars by role
+AVATARS: Final[dict[str, str]] = {"user": "👤", "assistant": "🤖"}
+
+# RAG flow definition, reloaded when modified
+FLOW_FILE: Final[str] = "Rag.flyde"
+
 # =============================================================================
 # CORE APPLICATION LOGIC
 # =============================================================================
 
 
-@dataclass
+class ResponseQueue(SimpleQueue):
+    """Queue that sets the ready event whenever the flow puts an item into it."""
+
+    def __init__(self, ready: threading.Event):
+        super().__init__()
+        self.ready = ready
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None):
+        super().put(item, block, timeout)
+        self.ready.set()
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of responses keyed by normalized prompt."""
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, response: str):
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize prompt case and whitespace to use it as a cache key."""
+    return " ".join(prompt.lower().split())
+
+
+@dataclass(frozen=True)
 class FlowWrapper:
+    # Slots instead of dataclass(slots=True) to keep the weakref slot on Python 3.10
+    __slots__ = ("flow", "query", "response", "ready", "__weakref__")
+
     flow: Flow
     query: Queue
-    response: Queue
+    response: ResponseQueue
+    ready: threading.Event
+
+
+def fix_torch_classes_path():
+    """Fix streamlit torch classes path warning once the flow has imported torch."""
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.classes.__path__ = []  # type: ignore
+
 
+def _shutdown_flow(query_q: Queue):
+    """Close the flow input so that its worker threads can finish."""
+    logging.info("Shutting down the RAG flow")
+    query_q.put(EOF)
 
-@st.cache_resource
-def wrap_flow() -> FlowWrapper:
-    """Load and initialize the RAG flow with error handling."""
+
+def _load_flow(path: str) -> FlowWrapper:
+    """Load and start the RAG flow. Runs in a background thread, so it must not call Streamlit."""
+    flow = Flow.from_file(path)
+    query_q = flow.node.inputs["query"].queue
+    ready = threading.Event()
+    response_q = ResponseQueue(ready)
+    flow.node.outputs["response"].connect(response_q)  # type: ignore
+    flow.run()
+    flow_wrapper = FlowWrapper(flow, query_q, response_q, ready)
+    # Release the flow threads on exit or reload instead of leaking them via the cached singleton
+    weakref.finalize(flow_wrapper, _shutdown_flow, query_q)
+    return flow_wrapper
+
+
+@st.cache_resource(max_entries=1)
+def prefetch_flow(path: str, mtime: float) -> Future[FlowWrapper]:
+    """Start loading the RAG flow in the background.
+
+    The flow file modification time is part of the cache key, so the flow is reloaded after it is edited."""
+    logging.info(f"Loading the RAG flow from {path} in the background")
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="flow-loader").submit(_load_flow, path)
+
+
+@st.cache_resource(max_entries=1)
+def wrap_flow(path: str, mtime: float) -> FlowWrapper:
+    """Wait for the RAG flow to finish loading with error handling."""
     try:
         with st.spinner("🚀 Loading knowledge base..."):
-            flow = Flow.from_file("Rag.flyde")
-            query_q = flow.node.inputs["query"].queue
-            response_q: Queue = Queue()
-            flow.node.outputs["response"].connect(response_q)
-            flow.run()
-            return FlowWrapper(flow, query_q, response_q)
+            flow_wrapper = prefetch_flow(path, mtime).result()
+        fix_torch_classes_path()
+        return flow_wrapper
     except Exception as e:
+        # Don't keep the failed load cached, so that the next run retries it
+        prefetch_flow.clear()
         st.error(f"❌ Failed to load knowledge base: {str(e)}")
         st.stop()
 
 
-def get_response_with_timeout(response_queue: Queue, timeout: int = 120) -> str:
-    """Get response from queue with timeout handling."""
-    logging.info(f"Waiting for response with {timeout}s timeout...")
-    try:
-        response = response_queue.get(timeout=timeout)
-        logging.info("Response received successfully")
-        return response
-    except Empty:
-        logging.warning(f"Request timed out after {timeout} seconds")
-        return "⚠️ Request timed out. Please try again with a shorter question or check if the model is running."
+def get_flow() -> FlowWrapper:
+    """Get the RAG flow for the current version of the flow file."""
+    return wrap_flow(FLOW_FILE, os.path.getmtime(FLOW_FILE))
+
+
+@st.cache_resource(max_entries=1)
+def wrap_response_cache(mtime: float) -> ResponseCache:
+    """Response cache shared by all sessions.
+
+    Keyed by the flow file modification time like the flow, so that answers of an edited flow are not reused."""
+    return ResponseCache()
+
+
+def response_cache() -> ResponseCache:
+    """Get the response cache for the current version of the flow file."""
+    return wrap_response_cache(os.path.getmtime(FLOW_FILE))
+
+
+def get_response_with_timeout(flow_wrapper: FlowWrapper, timeout: int = 120) -> list[Any] | None:
+    """Wait for the ready event and drain all available items from the response queue.
+
+    Returns None if nothing arrived within the timeout."""
+    if not flow_wrapper.ready.wait(timeout):
+        return None
+    # Clear before draining so that an item put while draining sets the event again
+    flow_wrapper.ready.clear()
+    items = []
+    while True:
+        try:
+            items.append(flow_wrapper.response.get_nowait())
+        except Empty:
+            return items
+
+
+def stream_response(flow_wrapper: FlowWrapper, cache_key: str, timeout: int = 120) -> Iterator[str]:
+    """Yield response tokens as they arrive, with timeout handling.
+
+    Complete responses are saved to the response cache under cache_key."""
+    logging.info(f"Streaming response with {timeout}s timeout...")
+    tokens = []
+    while True:
+        items = get_response_with_timeout(flow_wrapper, timeout)
+        if items is None:
+            logging.warning(f"Request timed out after {timeout} seconds")
+            yield "⚠️ Request timed out. Please try again with a shorter question or check if the model is running."
+            return
+
+        # Tokens drained in one wakeup are rendered as a single chunk
+        batch: list[str] = []
+        finished = False
+        for token in items:
+            if token == END_OF_RESPONSE or is_EOF(token):
+                finished = True
+                break
+            batch.append(token)
+
+        if batch:
+            chunk = "".join(batch)
+            tokens.append(chunk)
+            yield chunk
 
+        if finished:
+            if is_EOF(token):
+                yield "👋 **Goodbye! Thanks for using SWLWI Knowledge Base!**"
+                st.balloons()
+                st.stop()
 
-def show_typing_indicator(placeholder):
-    """Show animated typing indicator."""
-    for i in range(3):
-        placeholder.markdown("🤔 Assistant is thinking" + "." * (i + 1))
-        time.sleep(0.3)
+            logging.info("Response received successfully")
+            response_cache().put(cache_key, "".join(tokens))
+            return
+
+
+EXIT_COMMANDS: Final[frozenset[str]] = frozenset({"/bye", "bye", "exit", "quit"})
 
 
 def handle_exit_command():
     """Handle graceful exit when user types /bye."""
-    with st.chat_message("assistant", avatar="🤖"):
+    with st.chat_message("assistant", avatar=AVATARS["assistant"]):
         st.markdown("👋 **Goodbye! Thanks for using SWLWI Knowledge Base!**")
-    try:
-        st.session_state.flow_wrapper.query.put(EOF)
-    except Exception:
-        pass
+    # Only end this session: the cached flow is shared and stays warm for other sessions
+    st.session_state.clear()
+    # Balloons are animated client-side, no need to hold the script thread for them
     st.balloons()
-    time.sleep(2)
     st.stop()
 
 
-def process_user_query(prompt: str, flow_wrapper: FlowWrapper) -> str:
-    """Process user query and return response."""
+def process_user_query(prompt: str, flow_wrapper: FlowWrapper) -> Iterator[str]:
+    """Process user query and return a stream of response tokens."""
+    cache_key = normalize_prompt(prompt)
+    cached = response_cache().get(cache_key)
+    if cached is not None:
+        logging.info(f"Returning cached response for: {prompt[:50]}...")
+        return iter([cached])
+
     logging.info(f"Sending query: {prompt[:50]}...")
+    # The flow input forwards each query straight to unbounded queues, so this never blocks the script thread
     flow_wrapper.query.put(prompt)
-    response = get_response_with_timeout(flow_wrapper.response)
-
-    if response == EOF:
-        st.markdown("👋 **Goodbye! Thanks for using SWLWI Knowledge Base!**")
-        st.balloons()
-        st.stop()
-
-    return response
+    return stream_response(flow_wrapper, cache_key)
 
 
 def initialize_session_state():
     """Initialize session state variables."""
     if "messages" not in st.session_state:
         st.session_state.messages = []
-    if "flow_wrapper" not in st.session_state:
-        st.session_state.flow_wrapper = wrap_flow()
+
+
+WELCOME_MARKDOWN: Final[str] = """👋 **Welcome to the Software Leads Weekly Index Knowledge Base!**
+
+I'm here to help you with questions about:
+- 🎯 Software leadership and management
+- 🔧 Technical best practices
+- 👥 Team building and culture
+- 📈 Industry insights and trends
+
+**Try asking me anything about software leadership!**"""
 
 
 def display_welcome_message():
     """Display welcome message for new users."""
     if not st.session_state.messages:
-        with st.chat_message("assistant", avatar="🤖"):
-            st.markdown("""
-            👋 **Welcome to the Software Leads Weekly Index Knowledge Base!**
-
-            I'm here to help you with questions about:
-            - 🎯 Software leadership and management
-            - 🔧 Technical best practices
-            - 👥 Team building and culture
-            - 📈 Industry insights and trends
-
-            **Try asking me anything about software leadership!**
-            """)
+        with st.chat_message("assistant", avatar=AVATARS["assistant"]):
+            st.markdown(WELCOME_MARKDOWN)
 
 
 def display_chat_history():
     """Display all messages in chat history."""
     for message in st.session_state.messages:
-        avatar = "👤" if message["role"] == "user" else "🤖"
-        with st.chat_message(message["role"], avatar=avatar):
+        with st.chat_message(message["role"], avatar=AVATARS[message["role"]]):
             st.markdown(message["content"])
 
 
@@ -143,45 +291,48 @@ def process_chat_input():
     """Handle new chat input from user."""
     if prompt := st.chat_input("Ask me anything about software leadership... (type '/bye' to exit)", key="chat_input"):
         # Handle exit command
-        if prompt.strip().lower() in ["/bye", "bye", "exit", "quit"]:
+        if prompt.strip().lower() in EXIT_COMMANDS:
             handle_exit_command()
 
         # Add user message
         st.session_state.messages.append({"role": "user", "content": prompt})
 
         # Display user message
-        with st.chat_message("user", avatar="👤"):
+        with st.chat_message("user", avatar=AVATARS["user"]):
             st.markdown(prompt)
 
         # Get and display response
-        with st.chat_message("assistant", avatar="🤖"):
-            # Show typing indicator
-            typing_placeholder = st.empty()
-            show_typing_indicator(typing_placeholder)
-            typing_placeholder.empty()
-
-            # Process response
-            with st.spinner("Processing your question... (This may take up to 2 minutes for the first question)"):
-                try:
-                    response = process_user_query(prompt, st.session_state.flow_wrapper)
-                    st.markdown(response)
-                except Exception as e:
-                    response = f"❌ Sorry, I encountered an error: {str(e)}"
-                    st.markdown(response)
+        with st.chat_message("assistant", avatar=AVATARS["assistant"]):
+            try:
+                # Spin only until the first chunk arrives, then stream the rest as it comes
+                with st.spinner("🤔 Thinking... (This may take up to 2 minutes for the first question)"):
+                    stream = process_user_query(prompt, get_flow())
+                    first_chunk = next(stream, "")
+                response = st.write_stream(chain([first_chunk], stream))
+            except Exception as e:
+                response = f"❌ Sorry, I encountered an error: {str(e)}"
+                st.markdown(response)
 
         # Add assistant response to history
         st.session_state.messages.append({"role": "assistant", "content": response})
 
 
+@st.fragment
+def display_chat():
+    """Display the chat interface as a fragment, so that new input reruns only the chat and not the whole page."""
+    # Initialized here rather than in main(), fragment reruns skip main() and the state is cleared on exit
+    initialize_session_state()
+    display_welcome_message()
+    display_chat_history()
+    process_chat_input()
+
+
 # =============================================================================
 # VISUAL STYLING & DECORATIONS
 # =============================================================================
 
 
-def apply_custom_styles():
-    """Apply custom CSS styling to the app."""
-    st.markdown(
-        """
+CUSTOM_CSS: Final[str] = """
     <style>
     .main-header {
         text-align: center;
@@ -200,34 +351,37 @@ def apply_custom_styles():
         margin: 0.2rem 0;
     }
     </style>
-    """,
-        unsafe_allow_html=True,
-    )
-
+    """
 
-def display_header():
-    """Display the main header with styling."""
-    st.markdown(
-        """
+HEADER_HTML: Final[str] = """
     <div class="main-header">
         <h1>🚀 Software Leads Weekly Index KB</h1>
         <p style="font-size: 1.2em; margin: 0;">Your AI assistant for software leadership insights</p>
     </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    """
+
+FOOTER_HTML: Final[str] = (
+    "<div style='text-align: center; color: #666; padding: 1rem;'>"
+    "💡 <strong>Tip:</strong> Try asking specific questions about software leadership, "
+    "team management, or technical best practices for the best results!"
+    "</div>"
+)
+
+
+def apply_custom_styles():
+    """Apply custom CSS styling to the app."""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+
+def display_header():
+    """Display the main header with styling."""
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 
 def display_footer():
     """Display footer with helpful tips."""
     st.markdown("---")
-    st.markdown(
-        "<div style='text-align: center; color: #666; padding: 1rem;'>"
-        "💡 <strong>Tip:</strong> Try asking specific questions about software leadership, "
-        "team management, or technical best practices for the best results!"
-        "</div>",
-        unsafe_allow_html=True,
-    )
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
 # =============================================================================
@@ -237,19 +391,16 @@ def display_footer():
 
 def main():
     """Main application entry point."""
+    # Start loading the flow while the page renders
+    prefetch_flow(FLOW_FILE, os.path.getmtime(FLOW_FILE))
+    fix_torch_classes_path()
+
     # Apply visual styling
     apply_custom_styles()
     display_header()
 
-    # Initialize core app state
-    initialize_session_state()
-
-    # Display chat interface
-    display_welcome_message()
-    display_chat_history()
-
-    # Handle user input
-    process_chat_input()
+    # Display chat interface and handle user input
+    display_chat()
 
     # Display footer
     display_footer()
@@ -0,0 +1,39 @@
+"""Embeddings model shared by the RAG components."""
+
+import logging
+import os
+import threading
+from functools import lru_cache
+
+from langchain_huggingface import HuggingFaceEmbeddings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Set EMBEDDINGS_BACKEND=onnx to run the int8-quantized ONNX export of the model with ONNX Runtime
+# (needs the "onnx" extra). Its vectors differ slightly from the default torch ones, so re-index after switching.
+_ONNX_MODEL_KWARGS = {"backend": "onnx", "model_kwargs": {"file_name": "onnx/model_qint8_avx512_vnni.onnx"}}
+
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_embeddings(model_name: str) -> HuggingFaceEmbeddings:
+    if os.getenv("EMBEDDINGS_BACKEND", "torch").lower() == "onnx":
+        logger.info(f"Loading quantized ONNX embeddings model {model_name}")
+        return HuggingFaceEmbeddings(model_name=model_name, model_kwargs=_ONNX_MODEL_KWARGS)
+    logger.info(f"Loading embeddings model {model_name}")
+    return HuggingFaceEmbeddings(model_name=model_name)
+
+
+def get_embeddings(model_name: str = DEFAULT_MODEL_NAME) -> HuggingFaceEmbeddings:
+    """
+    Return the embeddings model for the given name, loading it once per process.
+
+    Flyde loads each component class from its own copy of the module, so the model is cached here
+    rather than in the component module to share it between components and flow reloads.
+    """
+    # Components initialize in their own threads, load the model only once if they do it at the same time
+    with _lock:
+        return _load_embeddings(model_name)
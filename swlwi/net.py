@@ -1,52 +1,276 @@
 """Network client utilities for web scraping with HTTP and browser automation."""
 
+import asyncio
 import atexit
+import codecs
 import logging
+import os
 import re
+import threading
 import time
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Optional
+from urllib.parse import urlsplit
 
-import chardet
 import requests
-from playwright.sync_api import Page, sync_playwright
+from charset_normalizer import from_bytes
+from requests.adapters import HTTPAdapter
+from playwright.sync_api import Page, Route, sync_playwright
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Patterns and indicators used for response analysis, compiled and built once at import time
+# Content analysis works on lowercased raw bytes to avoid decoding the whole document
+# Paragraphs may contain inline markup such as links, which is stripped before measuring the text
+# A paragraph ends at the next <p> or </p>, so unclosed paragraphs don't make each match scan to the end of the page
+_PARAGRAPH_RE = re.compile(rb"<p(?:\s[^>]*)?>([^<]*(?:<(?!/?p[\s>])[^<]*)*)</p>")
+_TAG_RE = re.compile(rb"<[^>]+>")
+_HTML_TAG_RE = re.compile(rb"<html", re.IGNORECASE)
+# Gaps between the words are bounded to 100 bytes, so that a long single-line page can't make the search backtrack
+# quadratically. Words further apart than that don't count as an indicator.
+# "please enable javascript" is already covered by "enable javascript".
+_JS_INDICATORS_RE = re.compile(
+    b"|".join(
+        [
+            rb"enable.{1,100}javascript",
+            rb"javascript.{1,100}required",
+            rb"javascript.{1,100}disabled",
+            rb"turn.{1,100}on.{1,100}javascript",
+            rb"javascript.{1,100}must.{1,100}be.{1,100}enabled",
+            rb"requires.{1,100}javascript",
+            rb"<noscript",
+            rb'id=["\']root["\']',
+            rb'id=["\']app["\']',
+            rb"loading.{0,100}app",
+            rb"react.{0,100}app",
+            rb"vue.{0,100}app",
+            rb"angular.{0,100}app",
+            rb"bundle.{0,100}\.js",
+            rb"window\.__.{0,100}__",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# Only check the first 2KB for encoding detection, the charset is declared in the head
+# and the detector is slow on large inputs
+_CHARSET_SAMPLE_SIZE = 2048
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([a-z0-9_\-:.]+)""", re.IGNORECASE)
+# UTF-32 marks go first, because the UTF-32 LE mark starts with the UTF-16 LE one
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Non-UTF-8 content is converted in chunks of this size to bound the memory used by the intermediate text
+_TRANSCODE_CHUNK_SIZE = 65536
+
+# Magic numbers of compressed content
+_COMPRESSION_MAGIC = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bzip2",
+    b"\x78\x9c": "zlib",
+    b"\x78\x01": "zlib",
+    b"\x78\xda": "zlib",
+}
+_COMPRESSED_PREFIXES = tuple(_COMPRESSION_MAGIC)
+
+_CF_HEADERS = ("cf-ray", "cf-cache-status", "cf-request-id", "server", "cf-bgj", "cf-polished")
+_CF_SCAN_SIZE = 65536
+# Body indicators are scanned in a single pass each, case-insensitively so the body isn't lowered first
+_CF_BODY_RE = re.compile(
+    b"|".join(
+        re.escape(indicator)
+        for indicator in [
+            b"cloudflare",
+            b"checking your browser",
+            b"ddos protection",
+            b"enable javascript",
+            b"browser check",
+            b"security check",
+            b"cf-browser-verification",
+            b"challenge-platform",
+        ]
+    ),
+    re.IGNORECASE,
+)
+_BLOCKED_RE = re.compile(
+    b"|".join(
+        re.escape(indicator)
+        for indicator in [
+            b"access denied",
+            b"403 forbidden",
+            b"404 not found",
+            b"page not found",
+            b"blocked",
+            b"restricted",
+            b"paywall",
+            b"subscription required",
+            b"login required",
+            b"sign in to continue",
+            b"premium content",
+        ]
+    ),
+    re.IGNORECASE,
+)
+_HTML_INDICATORS = (b"<!doctype html", b"<html", b"<head", b"<body")
+_BASIC_HTML_INDICATORS = (b"<html", b"<body", b"<head")
+_ARTICLE_INDICATORS = (b"<article", b"<main", b"article-content", b"story-content", b"post-content", b"entry-content")
+# More lenient content structure indicators for has_meaningful_content
+_CONTENT_INDICATORS = _ARTICLE_INDICATORS + (b"<section", b"<div")
+_MINIMAL_CONTENT_TAGS = (b"<article", b"<main", b"<section", b"<p>")
+
+_SKIP_DOMAINS = frozenset({"x.com", "youtube.com"})
+# JS-heavy sites, matched exactly or as a parent domain
+_JS_DOMAINS = frozenset(
+    {
+        "medium.com",
+        "substack.com",
+        "ghost.io",
+        "notion.site",
+        "vercel.app",
+        "netlify.app",
+        "firebase.app",
+        "web.app",
+    }
+)
+_JS_DOMAIN_SUFFIXES = tuple(f".{domain}" for domain in _JS_DOMAINS)
+
+# Selectors probed in the browser page
+_CF_CHALLENGE_SELECTOR = "iframe[src*='challenges'], #challenge-form"
+_CONTENT_LOADED_JS = """() =>
+    !!document.querySelector("article, [data-testid='storyContent'], .story-content, .article-content")
+    || document.querySelectorAll("p").length > 3
+    || document.querySelectorAll("h1, h2, h3").length > 0
+"""
+
+# Browser requests that don't contribute to the page text
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+_TRACKER_HOSTS = frozenset(
+    {
+        "www.google-analytics.com",
+        "www.googletagmanager.com",
+        "stats.g.doubleclick.net",
+        "connect.facebook.net",
+        "static.hotjar.com",
+        "cdn.segment.com",
+        "js.hs-analytics.net",
+    }
+)
+
 
 class RateLimiter:
-    """Singleton class to handle rate limiting per domain."""
+    """Rate limiting per domain. Clients share DEFAULT_RATE_LIMITER unless given their own."""
 
-    _instance = None
-    _last_request_time: dict[str, datetime] = {}
-    _timeout: float = 1
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(RateLimiter, cls).__new__(cls)
-        return cls._instance
+    def __init__(self, timeout: float = 1):
+        self._timeout_ns = int(timeout * 1_000_000_000)
+        # Monotonic time in nanoseconds of the last reserved request slot per domain
+        self._last_request_time: dict[str, int] = {}
+        self._lock = threading.Lock()
 
     def wait(self, domain: str):
-        """Wait if necessary to respect rate limiting for the given domain."""
-        now = datetime.now()
-        if domain in self._last_request_time:
-            elapsed = (now - self._last_request_time[domain]).total_seconds()
-            if elapsed < self._timeout:
-                sleep_time = self._timeout - elapsed
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds before fetching from {domain}")
-                time.sleep(sleep_time)
-        self._last_request_time[domain] = datetime.now()
+        """
+        Wait if necessary to respect rate limiting for the given domain.
+
+        Safe to call from multiple threads: each call reserves the next free time slot for the domain
+        and sleeps outside of the lock, so requests to different domains don't delay each other.
+        """
+        sleep_time = self.reserve(domain)
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds before fetching from {domain}")
+            time.sleep(sleep_time)
+
+    async def wait_async(self, domain: str):
+        """
+        Wait if necessary to respect rate limiting for the given domain without blocking the event loop.
+
+        Shares the time slots with wait(), so sync and async callers are rate limited together.
+        """
+        sleep_time = self.reserve(domain)
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds before fetching from {domain}")
+            await asyncio.sleep(sleep_time)
+
+    def reserve(self, domain: str) -> float:
+        """
+        Reserve the next free time slot for the domain and return the number of seconds until it.
+
+        For callers that schedule the request themselves instead of sleeping in wait().
+        """
+        # The lock is only held for the bookkeeping, never while sleeping, so it's safe to take in a coroutine
+        with self._lock:
+            now = time.monotonic_ns()
+            last = self._last_request_time.get(domain)
+            request_time = now if last is None else max(now, last + self._timeout_ns)
+            self._last_request_time[domain] = request_time
+
+        # Plain integer bookkeeping, converted to seconds only when there is something to wait for
+        return (request_time - now) / 1e9 if request_time > now else 0.0
+
+
+# Rate limiter shared by all clients in the process
+DEFAULT_RATE_LIMITER = RateLimiter()
+
+# Set HTTP_CACHE to a file path to keep fetched pages in an on-disk SQLite cache between runs (needs the "cache" extra).
+# Not-found pages are cached as well, so that re-runs don't keep requesting dead article links.
+_HTTP_CACHE_EXPIRE_AFTER = timedelta(days=1)
+_HTTP_CACHE_ALLOWABLE_CODES = (200, 404)
+
+
+def _create_session() -> requests.Session:
+    """Create the session for an HTTP client, backed by the on-disk response cache if it is enabled."""
+    cache_path = os.getenv("HTTP_CACHE")
+    if not cache_path:
+        return requests.Session()
+
+    from requests_cache import CachedSession
+
+    logger.debug(f"Caching HTTP responses in {cache_path}")
+    return CachedSession(
+        cache_path,
+        backend="sqlite",
+        expire_after=_HTTP_CACHE_EXPIRE_AFTER,
+        allowable_codes=_HTTP_CACHE_ALLOWABLE_CODES,
+        # Revalidate with ETag/Last-Modified and follow the server's Cache-Control, fall back to the cache if it fails
+        cache_control=True,
+        stale_if_error=True,
+    )
 
 
 class HTTPClient:
     """HTTP client with proper headers and rate limiting."""
 
     def __init__(self, rate_limiter: Optional[RateLimiter] = None):
-        self.rate_limiter = rate_limiter or RateLimiter()
-        self.session = requests.Session()
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self.session = _create_session()
+        self._setup_connection_pool()
         self._setup_default_headers()
 
+    def _setup_connection_pool(self):
+        """Keep connections to many domains alive and retry transient gateway errors."""
+        # The default pool only keeps 10 hosts, so a crawl across many domains keeps redoing TLS handshakes
+        adapter = HTTPAdapter(
+            pool_connections=100,
+            pool_maxsize=100,
+            # Once the retries are used up the last 502/504 response is returned like any other error status
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 504],
+                allowed_methods=["GET"],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _setup_default_headers(self):
         """Set up default headers to mimic a real browser."""
         self.session.headers.update(
@@ -65,13 +289,22 @@ class HTTPClient:
             }
         )
 
+    def is_cached(self, url: str) -> bool:
+        """Check if a GET of the URL will be served from the response cache without a request to the server."""
+        cache = getattr(self.session, "cache", None)
+        if cache is None or not cache.contains(url=url):
+            return False
+        # Expired responses are revalidated with the server, so they still count as a request
+        response = cache.get_response(cache.create_key(requests.Request("GET", url)))
+        return response is not None and not response.is_expired
+
     def get(self, url: str, use_rate_limiting: bool = True, **kwargs) -> requests.Response:
         """
         Perform a GET request with rate limiting and proper error handling.
 
         Args:
             url: The URL to fetch
-            use_rate_limiting: Whether to apply rate limiting
+            use_rate_limiting: Whether to apply rate limiting, responses served from the cache are never delayed
             **kwargs: Additional arguments to pass to requests.get
 
         Returns:
@@ -80,7 +313,7 @@ class HTTPClient:
         Raises:
             requests.RequestException: On HTTP errors
         """
-        if use_rate_limiting:
+        if use_rate_limiting and not self.is_cached(url):
             domain = extract_domain_from_url(url)
             self.rate_limiter.wait(domain)
 
@@ -88,12 +321,51 @@ class HTTPClient:
         if "stream" not in kwargs:
             kwargs["stream"] = False
 
-        response = self.session.get(url, **kwargs)
+        # Without streaming the body is read and decompressed here already
+        return self.session.get(url, **kwargs)
+
+    async def get_async(self, url: str, use_rate_limiting: bool = True, **kwargs) -> requests.Response:
+        """
+        Perform a GET request without blocking the event loop.
+
+        The rate limiting wait is awaited and the request itself runs in a worker thread on the shared
+        session, so coroutines fetching from different domains proceed concurrently.
+
+        Args:
+            url: The URL to fetch
+            use_rate_limiting: Whether to apply rate limiting
+            **kwargs: Additional arguments to pass to get
+
+        Returns:
+            requests.Response object
 
-        # Force decompression of content if it's compressed
-        _ = response.content  # This triggers decompression
+        Raises:
+            requests.RequestException: On HTTP errors
+        """
+        if use_rate_limiting and not self.is_cached(url):
+            await self.rate_limiter.wait_async(extract_domain_from_url(url))
+        return await asyncio.to_thread(self.get, url, use_rate_limiting=False, **kwargs)
 
-        return response
+    async def get_many_async(
+        self, urls: Iterable[str], **kwargs
+    ) -> list[tuple[str, requests.Response | requests.RequestException]]:
+        """
+        Fetch multiple URLs concurrently with asyncio, respecting the per-domain rate limiting.
+
+        Args:
+            urls: The URLs to fetch
+            **kwargs: Additional arguments to pass to get_async
+
+        Returns:
+            (url, response) tuples in the order of the URLs, with the exception in place
+            of the response if the request failed
+        """
+        urls = list(urls)
+        results = await asyncio.gather(*(self.get_async(url, **kwargs) for url in urls), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, requests.RequestException):
+                raise result
+        return list(zip(urls, results))  # type: ignore
 
     def is_cloudflare_protected(self, response: requests.Response) -> bool:
         """Check if the response indicates CloudFlare protection."""
@@ -102,31 +374,52 @@ class HTTPClient:
             return True
 
         # Check response headers for CloudFlare indicators
-        cf_headers = ["cf-ray", "cf-cache-status", "cf-request-id", "server", "cf-bgj", "cf-polished"]
-        for header in cf_headers:
+        for header in _CF_HEADERS:
             if header in response.headers:
                 return True
 
-        # Check response body for CloudFlare content
-        response_text = response.text.lower()
-        cf_indicators = [
-            "cloudflare",
-            "checking your browser",
-            "ddos protection",
-            "enable javascript",
-            "browser check",
-            "security check",
-            "cf-browser-verification",
-            "challenge-platform",
-        ]
-
-        return any(indicator in response_text for indicator in cf_indicators)
+        # Check response body for CloudFlare content, on raw bytes so that the body isn't decoded just for this.
+        # Challenge markers are at the top of the page, so only the beginning needs to be scanned.
+        return _CF_BODY_RE.search(response.content, 0, _CF_SCAN_SIZE) is not None
 
     def needs_javascript(self, response: requests.Response) -> bool:
         """Check if the response indicates JavaScript is required."""
-        # Use the utility function for analysis
+        # A single analysis pass covers both the JavaScript indicators and the content checks
         analysis = analyze_response_quality(response.content)
-        return analysis["needs_javascript"] or not has_meaningful_content(response.content)
+        return analysis["needs_javascript"] or not analysis["has_meaningful_content"]
+
+    def _detect_encoding(self, content: bytes) -> str:
+        """
+        Detect the encoding of the content, falling back to UTF-8.
+
+        Cheap checks go first: byte order marks, pure ASCII and the charset declared in the HTML head.
+        The statistical detector only runs on a bounded sample if none of them apply.
+        """
+        for bom, bom_encoding in _BOM_ENCODINGS:
+            if content.startswith(bom):
+                logger.debug(f"Found {bom_encoding} byte order mark")
+                return bom_encoding
+
+        if content.isascii():
+            # Pure ASCII is valid UTF-8, no need to run the detector
+            logger.debug("Content is ASCII, using UTF-8")
+            return "utf-8"
+
+        declared = _META_CHARSET_RE.search(content, 0, _CHARSET_SAMPLE_SIZE)
+        if declared:
+            try:
+                encoding = codecs.lookup(declared.group(1).decode("ascii")).name
+                logger.debug(f"Using declared charset: {encoding}")
+                return encoding
+            except LookupError:
+                logger.debug(f"Ignoring unknown declared charset: {declared.group(1)!r}")
+
+        best = from_bytes(content[:_CHARSET_SAMPLE_SIZE]).best()
+        if best is not None and best.chaos < 0.3:
+            logger.debug(f"Detected encoding: {best.encoding} (chaos: {best.chaos:.2f})")
+            return best.encoding
+        logger.debug("Using UTF-8 fallback (low confidence or no detection)")
+        return "utf-8"
 
     def decode_response_content(self, response: requests.Response) -> bytes:
         """
@@ -142,13 +435,10 @@ class HTTPClient:
         content = response.content
         logger.debug(f"Raw content length: {len(content)} bytes")
 
-        # Check if content appears to be compressed but wasn't decompressed
-        if content.startswith(b"\x1f\x8b"):  # gzip magic number
-            logger.warning("Content appears to be gzip compressed but wasn't decompressed")
-        elif content.startswith(b"BZh"):  # bzip2 magic number
-            logger.warning("Content appears to be bzip2 compressed but wasn't decompressed")
-        elif len(content) > 0 and content[0:2] in [b"\x78\x9c", b"\x78\x01", b"\x78\xda"]:  # zlib
-            logger.warning("Content appears to be zlib compressed but wasn't decompressed")
+        # Check if content appears to be compressed but wasn't decompressed, with a single prefix test
+        if content.startswith(_COMPRESSED_PREFIXES):
+            compression = next(name for prefix, name in _COMPRESSION_MAGIC.items() if content.startswith(prefix))
+            logger.warning(f"Content appears to be {compression} compressed but wasn't decompressed")
 
         # Get the encoding from response headers or detect it
         encoding = response.encoding
@@ -157,42 +447,30 @@ class HTTPClient:
         # If no encoding is specified or it's invalid, try to detect it
         if not encoding or encoding.lower() == "iso-8859-1":
             # requests defaults to ISO-8859-1 when no charset is specified
-            # Try to detect the actual encoding from content
-            try:
-                detected = chardet.detect(content[:10000])  # Only check first 10KB for speed
-                if detected and detected["encoding"] and detected["confidence"] > 0.7:
-                    encoding = detected["encoding"]
-                    logger.debug(f"Detected encoding: {encoding} (confidence: {detected['confidence']:.2f})")
-                else:
-                    encoding = "utf-8"
-                    logger.debug("Using UTF-8 fallback (low confidence or no detection)")
-            except ImportError:
-                # chardet not available, fallback to utf-8
-                encoding = "utf-8"
-                logger.debug("chardet not available, using UTF-8 fallback")
+            encoding = self._detect_encoding(content)
 
         # Ensure we have a valid encoding
         if not encoding:
             encoding = "utf-8"
 
         try:
-            # Decode content using detected/specified encoding and re-encode as UTF-8
-            if encoding.lower() != "utf-8":
-                decoded_content = content.decode(encoding, errors="replace")
-                result = decoded_content.encode("utf-8")
+            # Decode content using detected/specified encoding and re-encode as UTF-8,
+            # normalizing aliases such as "utf8" so that UTF-8 content is never transcoded
+            if codecs.lookup(encoding).name != "utf-8":
+                result = _transcode_to_utf8(content, encoding)
                 logger.debug(f"Successfully decoded {len(content)} bytes using {encoding}")
                 return result
             else:
                 # Even if encoding is UTF-8, validate and clean the content
                 try:
-                    # Try to decode as UTF-8 to validate
-                    content.decode("utf-8")
+                    # ASCII is valid UTF-8, otherwise try to decode as UTF-8 to validate
+                    if not content.isascii():
+                        content.decode("utf-8")
                     logger.debug(f"Content already in UTF-8, returning {len(content)} bytes")
                     return content
                 except UnicodeDecodeError:
                     # Content is not valid UTF-8, decode with error replacement
-                    decoded_content = content.decode("utf-8", errors="replace")
-                    result = decoded_content.encode("utf-8")
+                    result = _transcode_to_utf8(content, "utf-8")
                     logger.debug(f"Fixed invalid UTF-8 content, returning {len(result)} bytes")
                     return result
         except (UnicodeDecodeError, LookupError) as e:
@@ -208,11 +486,31 @@ class HTTPClient:
                 return decoded_content.encode("utf-8")
 
 
+def _transcode_to_utf8(content: bytes, encoding: str) -> bytes:
+    """
+    Re-encode content from the given encoding to UTF-8, replacing invalid sequences.
+
+    Works in chunks so that the whole document never exists as an intermediate str.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    view = memoryview(content)
+    chunks = [
+        decoder.decode(view[start : start + _TRANSCODE_CHUNK_SIZE]).encode("utf-8")
+        for start in range(0, len(content), _TRANSCODE_CHUNK_SIZE)
+    ]
+    chunks.append(decoder.decode(b"", final=True).encode("utf-8"))
+    return b"".join(chunks)
+
+
 class BrowserClient:
     """Browser client for fetching JavaScript-heavy websites with CloudFlare bypass support."""
 
     _instance: Optional["BrowserClient"] = None
     _initialized: bool = False
+    # Navigations before the page is replaced, to drop DOM and JS heap state left by previous sites
+    _page_max_uses: int = 50
+    # Pages loading at the same time in fetch_many
+    _max_pages: int = 4
 
     def __new__(cls, rate_limiter: Optional[RateLimiter] = None):
         if cls._instance is None:
@@ -221,27 +519,60 @@ class BrowserClient:
 
     def __init__(self, rate_limiter: Optional[RateLimiter] = None):
         if not self._initialized:
-            self.rate_limiter = rate_limiter or RateLimiter()
+            self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
             self._browser: Optional[Any] = None
             self._context: Optional[Any] = None
             self._playwright: Optional[Any] = None
-            self._page: Optional[Page] = None
+            self._pages: list[Optional[Page]] = [None] * self._max_pages
+            self._page_uses = [0] * self._max_pages
             BrowserClient._initialized = True
 
             # Register cleanup for normal exit
             atexit.register(self.close)
 
-    def fetch(self, url: str, timeout: int = 5000) -> Optional[bytes]:
+    def fetch(self, url: str, timeout: int = 5000, content_timeout: int = 0) -> Optional[bytes]:
         """
         Fetch a URL using Playwright with CloudFlare bypass support.
 
         Args:
             url: The URL to fetch
             timeout: Timeout in milliseconds (reduced for performance)
+            content_timeout: Grace period in milliseconds for JS-rendered content to appear, 0 to read the page
+                as soon as the DOM is loaded
 
         Returns:
             HTML content as bytes, or None if fetch failed
         """
+        return self.fetch_many([url], timeout=timeout, content_timeout=content_timeout)[0]
+
+    def fetch_many(self, urls: list[str], timeout: int = 5000, content_timeout: int = 0) -> list[Optional[bytes]]:
+        """
+        Fetch several URLs, keeping up to `_max_pages` pages loading in the browser at the same time.
+
+        Each batch is navigated first and read afterwards, so the browser renders a page
+        while the next ones are being requested.
+
+        Args:
+            urls: The URLs to fetch
+            timeout: Timeout in milliseconds per page
+            content_timeout: Grace period in milliseconds for JS-rendered content to appear, 0 to skip it
+
+        Returns:
+            HTML content as bytes for each URL in order, or None where the fetch failed
+        """
+        results: list[Optional[bytes]] = []
+        for start in range(0, len(urls), self._max_pages):
+            batch = urls[start : start + self._max_pages]
+            pages = [self._navigate(slot, url, timeout) for slot, url in enumerate(batch)]
+            for url, navigation in zip(batch, pages):
+                if navigation is None:
+                    results.append(None)
+                else:
+                    results.append(self._read_page(url, *navigation, content_timeout=content_timeout))
+        return results
+
+    def _navigate(self, slot: int, url: str, timeout: int) -> Optional[tuple[Page, Any]]:
+        """Start loading a URL in the given page slot, returning once the response has been committed."""
         domain = extract_domain_from_url(url)
         logger.debug(f"Starting browser fetch for {url} (domain: {domain})")
 
@@ -255,31 +586,11 @@ class BrowserClient:
                 self._init_browser()
                 logger.debug("Browser initialized successfully")
 
-            # Reuse existing page or create new one
-            if self._page is None:
-                logger.debug("Creating new page...")
-                self._page = self._context.new_page()  # type: ignore
-                logger.debug("Page created successfully")
-
-            page = self._page
-            if page is None:
-                raise Exception("Failed to create page")
+            page = self._acquire_page(slot)
 
             logger.debug(f"Setting timeout to {timeout}ms")
             page.set_default_timeout(timeout)
 
-            # Enable stealth mode
-            logger.debug("Setting stealth headers")
-            page.set_extra_http_headers(
-                {
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "DNT": "1",
-                    "Sec-Ch-Ua": '"Chromium";v="120", "Google Chrome";v="120"',
-                    "Sec-Ch-Ua-Mobile": "?0",
-                    "Sec-Ch-Ua-Platform": '"Windows"',
-                }
-            )
-
             logger.debug(f"Navigating to {url}...")
             response = page.goto(url, wait_until="commit", timeout=timeout)
             logger.debug(f"Navigation completed, status: {response.status if response else 'None'}")
@@ -287,6 +598,16 @@ class BrowserClient:
             if response is None:
                 raise Exception("Failed to fetch page: empty response")
 
+            return page, response
+
+        except Exception as e:
+            logger.error(f"Failed to fetch {url} with browser: {e}")
+            logger.debug(f"Exception details: {type(e).__name__}: {str(e)}")
+            return None
+
+    def _read_page(self, url: str, page: Page, response: Any, content_timeout: int = 0) -> Optional[bytes]:
+        """Wait for a navigated page to settle and return its HTML."""
+        try:
             # Quick CloudFlare check - only if clearly detected
             if response.status in [403, 503]:
                 logger.debug(f"Potential CloudFlare challenge detected (status {response.status})")
@@ -305,6 +626,10 @@ class BrowserClient:
                 logger.debug("DOM content load timeout - continuing anyway")
                 pass  # Continue anyway
 
+            # Opt-in grace period for JS-rendered pages, returns as soon as the content is there
+            if content_timeout > 0 and not self._wait_for_content(page, content_timeout):
+                logger.debug("No meaningful content detected - continuing anyway")
+
             # Get the final HTML after all JavaScript execution
             logger.debug("Extracting page content...")
             html_content = page.content()
@@ -322,6 +647,24 @@ class BrowserClient:
             logger.debug(f"Exception details: {type(e).__name__}: {str(e)}")
             return None
 
+    def _acquire_page(self, slot: int = 0) -> Page:
+        """Return the page for a slot, replacing it with a fresh one once it has been used too many times."""
+        page = self._pages[slot]
+        if page is not None and self._page_uses[slot] >= self._page_max_uses:
+            logger.debug(f"Recycling page {slot} after {self._page_uses[slot]} navigations")
+            page.close()
+            page = None
+
+        if page is None:
+            logger.debug(f"Creating new page {slot}...")
+            page = self._context.new_page()  # type: ignore
+            self._pages[slot] = page
+            self._page_uses[slot] = 0
+            logger.debug("Page created successfully")
+
+        self._page_uses[slot] += 1
+        return page  # type: ignore
+
     def _init_browser(self):
         """Initialize the browser and context for reuse."""
         self._playwright = sync_playwright().start()
@@ -354,6 +697,14 @@ class BrowserClient:
             ignore_https_errors=True,
             reduced_motion="reduce",
             color_scheme="light",
+            # Stealth headers are set once for the context rather than on every fetch
+            extra_http_headers={
+                "Accept-Language": "en-US,en;q=0.9",
+                "DNT": "1",
+                "Sec-Ch-Ua": '"Chromium";v="120", "Google Chrome";v="120"',
+                "Sec-Ch-Ua-Mobile": "?0",
+                "Sec-Ch-Ua-Platform": '"Windows"',
+            },
         )
 
         # Add stealth scripts
@@ -365,103 +716,110 @@ class BrowserClient:
         """
         )
 
+        # Abort requests for assets and trackers, they dominate the page load time
+        self._context.route("**/*", _block_unneeded_request)  # type: ignore
+
+        # Pre-warm the page while the browser is starting up anyway
+        self._pages[0] = self._context.new_page()  # type: ignore
+        self._page_uses[0] = 0
+
     def close(self):
-        """Close the browser and cleanup resources."""
-        if self._page:
-            self._page.close()  # type: ignore
-            self._page = None
-        if self._context:
-            self._context.close()  # type: ignore
-            self._context = None
-        if self._browser:
-            self._browser.close()  # type: ignore
-            self._browser = None
-        if hasattr(self, "_playwright") and self._playwright:
-            self._playwright.stop()  # type: ignore
-
-    def __del__(self):
-        """Cleanup resources when the object is destroyed."""
+        """Close the browser and cleanup resources. Safe to call more than once."""
+        # Detach each resource before closing it, so that a failed or repeated close doesn't touch it again
+        pages = getattr(self, "_pages", [])
+        self._pages = [None] * self._max_pages
+        for page in pages:
+            if page is not None:
+                try:
+                    page.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close browser page: {e}")
+
+        for name in ("_context", "_browser"):
+            resource = getattr(self, name, None)
+            setattr(self, name, None)
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close browser {name.lstrip('_')}: {e}")
+
+        playwright = getattr(self, "_playwright", None)
+        self._playwright = None
+        if playwright is not None:
+            try:
+                playwright.stop()
+            except Exception as e:
+                logger.debug(f"Failed to stop Playwright: {e}")
+
+    def __enter__(self) -> "BrowserClient":
+        return self
+
+    def __exit__(self, *exc_info):
         self.close()
 
     def _wait_for_cloudflare(self, page: Page) -> bool:
         """Fast CloudFlare challenge detection and handling."""
         try:
-            # Very quick check for obvious CloudFlare challenges
-            challenge_selectors = [
-                "iframe[src*='challenges']",
-                "#challenge-form",
-            ]
-
-            for selector in challenge_selectors:
-                if page.locator(selector).count() > 0:
-                    logger.info("CloudFlare challenge detected, waiting for completion...")
-                    # Wait for challenge to disappear with much shorter timeout
-                    page.wait_for_selector(selector, state="detached", timeout=8000)
-                    return True
-            return True  # No challenge detected
+            # Very quick check for obvious CloudFlare challenges, all selectors in one query
+            if page.locator(_CF_CHALLENGE_SELECTOR).count() > 0:
+                logger.info("CloudFlare challenge detected, waiting for completion...")
+                # Wait for challenge to disappear with much shorter timeout
+                page.wait_for_selector(_CF_CHALLENGE_SELECTOR, state="detached", timeout=8000)
+            return True
 
         except PlaywrightTimeoutError:
             logger.warning("CloudFlare challenge timeout - continuing anyway")
             return True  # Continue even if challenge doesn't complete
 
-    def _check_content_loaded(self, page: Page) -> bool:
-        """Check if meaningful content is present on the page."""
+    def _wait_for_content(self, page: Page, timeout: int = 2000) -> bool:
+        """Wait until meaningful content is present on the page, or the timeout expires."""
         try:
-            # Check for presence of common content elements
-            content_present = any(
-                [
-                    page.locator("article").count() > 0,
-                    page.locator("[data-testid='storyContent']").count() > 0,
-                    page.locator(".story-content").count() > 0,
-                    page.locator(".article-content").count() > 0,
-                    # More generic content checks
-                    len(page.query_selector_all("p")) > 3,  # At least 3 paragraphs
-                    len(page.query_selector_all("h1,h2,h3")) > 0,  # At least one heading
-                ]
-            )
-
-            return content_present
-        except Exception:
+            # The predicate is polled inside the browser, so there is no round-trip per probe
+            page.wait_for_function(_CONTENT_LOADED_JS, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
             return False
+        except Exception as e:
+            logger.debug(f"Content check failed: {e}")
+            return False
+
 
-    def _wait_for_content(self, page: Page) -> bool:
-        """Ultra-fast content detection - minimal waiting."""
-        # Skip all waiting and just check if content exists now
-        return self._check_content_loaded(page)
+def _block_unneeded_request(route: Route) -> None:
+    """Playwright route handler that aborts requests not needed to extract the page content."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or urlsplit(request.url).hostname in _TRACKER_HOSTS:
+        route.abort()
+    else:
+        route.continue_()
 
 
+@lru_cache(maxsize=4096)
 def extract_domain_from_url(url: str) -> str:
     """Extract the domain from a URL."""
-    m = re.findall(r"https?://(?:[^./]+\.)*([^./]+\.[a-zA-Z][^./:]+)(?:/|$|:)", url)
-    return m[0] if m else "unknown"
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return "unknown"
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return "unknown"
+
+    # The last two labels of the host name, unless it is an IP address
+    labels = parts.hostname.rsplit(".", 2)
+    if len(labels) < 2 or not labels[-1][:1].isalpha():
+        return "unknown"
+    return ".".join(labels[-2:])
 
 
 def should_skip_domain(domain: str) -> bool:
     """Check if a domain should be skipped for fetching."""
-    skip_domains = ["x.com", "youtube.com"]
-    return domain in skip_domains
+    return domain in _SKIP_DOMAINS
 
 
 def is_content_blocked(content: bytes) -> bool:
     """Check if content appears to be blocked or restricted."""
     try:
-        text = content.decode("utf-8", errors="ignore").lower()
-
-        blocked_indicators = [
-            "access denied",
-            "403 forbidden",
-            "404 not found",
-            "page not found",
-            "blocked",
-            "restricted",
-            "paywall",
-            "subscription required",
-            "login required",
-            "sign in to continue",
-            "premium content",
-        ]
-
-        return any(indicator in text for indicator in blocked_indicators)
+        return _BLOCKED_RE.search(content) is not None
     except Exception:
         return False
 
@@ -474,15 +832,15 @@ def get_content_type_from_response(response) -> str:
         if content_type:
             return content_type.split(";")[0].strip()
 
-        # Fallback to content analysis
-        content = response.content[:1000]  # Check first 1KB
-        text = content.decode("utf-8", errors="ignore").lower()
+        # Fallback to content analysis, lowercasing only the few bytes needed for the prefix checks
+        content = response.content
+        head = content[:16].lower()
 
-        if text.startswith("<!doctype html") or "<html" in text:
+        if head.startswith(b"<!doctype html") or _HTML_TAG_RE.search(content, 0, 1000):  # Check first 1KB
             return "text/html"
-        elif text.startswith("{") or text.startswith("["):
+        elif head.startswith((b"{", b"[")):
             return "application/json"
-        elif text.startswith("<?xml"):
+        elif head.startswith(b"<?xml"):
             return "application/xml"
         else:
             return "text/plain"
@@ -494,7 +852,7 @@ def get_content_type_from_response(response) -> str:
 def analyze_response_quality(content: bytes, url: str = "") -> dict:
     """Analyze the quality and characteristics of response content."""
     try:
-        text = content.decode("utf-8", errors="ignore").lower()
+        text = content.lower()
 
         analysis = {
             "content_length": len(content),
@@ -503,57 +861,29 @@ def analyze_response_quality(content: bytes, url: str = "") -> dict:
             "has_article_content": False,
             "is_blocked": False,
             "needs_javascript": False,
+            "has_meaningful_content": False,
             "quality_score": 0.0,
         }
 
         # Check HTML structure
-        html_indicators = ["<!doctype html", "<html", "<head", "<body"]
-        analysis["has_html_structure"] = any(indicator in text for indicator in html_indicators)
+        analysis["has_html_structure"] = any(indicator in text for indicator in _HTML_INDICATORS)
 
         # Check for article content
-        content_indicators = [
-            "<article",
-            "<main",
-            "article-content",
-            "story-content",
-            "post-content",
-            "entry-content",
-        ]
-        analysis["has_article_content"] = any(indicator in text for indicator in content_indicators)
+        analysis["has_article_content"] = any(indicator in text for indicator in _ARTICLE_INDICATORS)
 
         # Check if blocked
-        analysis["is_blocked"] = is_content_blocked(content)
-
-        # Check if needs JavaScript with comprehensive detection
-        import re
-
-        js_indicators = [
-            r"enable.+javascript",
-            r"javascript.+required",
-            r"javascript.+disabled",
-            r"please.+enable.+javascript",
-            r"turn.+on.+javascript",
-            r"javascript.+must.+be.+enabled",
-            r"requires.+javascript",
-            r"<noscript",
-            r'id=["\']root["\']',
-            r'id=["\']app["\']',
-            r"loading.*app",
-            r"react.*app",
-            r"vue.*app",
-            r"angular.*app",
-            r"bundle.*\.js",
-            r"window\.__.*__",
-        ]
+        analysis["is_blocked"] = _BLOCKED_RE.search(text) is not None
 
         # Check for very short content without meaningful structure
-        has_minimal_content = len(text) < 1000 and not any(
-            tag in text for tag in ["<article", "<main", "<section", "<p>"]
-        )
+        has_minimal_content = len(text) < 1000 and not any(tag in text for tag in _MINIMAL_CONTENT_TAGS)
 
-        js_detected = any(re.search(pattern, text, re.IGNORECASE) for pattern in js_indicators)
+        # Check if needs JavaScript with comprehensive detection, scanning for all indicators at once
+        js_detected = _JS_INDICATORS_RE.search(text) is not None
         analysis["needs_javascript"] = js_detected or has_minimal_content
 
+        # Reuse the lowered text rather than having callers run has_meaningful_content separately
+        analysis["has_meaningful_content"] = _has_meaningful_text(text)
+
         # Calculate quality score (0.0 to 1.0)
         score = 0.0
         if analysis["content_length"] > 1000:
@@ -579,6 +909,7 @@ def analyze_response_quality(content: bytes, url: str = "") -> dict:
             "has_article_content": False,
             "is_blocked": False,
             "needs_javascript": False,
+            "has_meaningful_content": False,
             "quality_score": 0.0,
         }
 
@@ -586,57 +917,34 @@ def analyze_response_quality(content: bytes, url: str = "") -> dict:
 def has_meaningful_content(content: bytes) -> bool:
     """Check if the fetched content appears to have meaningful article content."""
     try:
-        text = content.decode("utf-8", errors="ignore").lower()
-
-        # Check for minimum content length (more lenient)
-        if len(text) < 200:
-            return False
-
-        # Check for article content indicators
-        content_indicators = [
-            "<article",
-            "<main",
-            "article-content",
-            "story-content",
-            "post-content",
-            "entry-content",
-            "<section",
-            "<div",  # More lenient
-        ]
+        return _has_meaningful_text(content.lower())
+    except Exception:
+        return False
 
-        # Check for reasonable amount of text content
-        import re
 
-        paragraphs = re.findall(r"<p[^>]*>([^<]+)</p>", text)
-        text_content = " ".join(paragraphs)
+def _has_meaningful_text(text: bytes) -> bool:
+    """Check already lowercased content for meaningful article content."""
+    # Check for minimum content length (more lenient)
+    if len(text) < 200:
+        return False
 
-        # Check for basic HTML structure
-        has_basic_html = any(tag in text for tag in ["<html", "<body", "<head"])
+    # Check for basic HTML structure
+    if not any(tag in text for tag in _BASIC_HTML_INDICATORS):
+        return False
 
-        # Check content structure (more lenient)
-        has_content_structure = any(indicator in text for indicator in content_indicators)
-        has_text_content = len(text_content.strip()) > 100  # More lenient
-        has_multiple_paragraphs = len(paragraphs) >= 2  # At least 2 paragraphs
+    # Check content structure (more lenient) first, the paragraph scan is only needed for pages without it
+    if any(indicator in text for indicator in _CONTENT_INDICATORS):
+        return True
 
-        # Return true if we have basic HTML and either content structure OR meaningful text
-        return has_basic_html and (has_content_structure or has_text_content or has_multiple_paragraphs)
-
-    except Exception:
-        return False
+    # Otherwise require at least 2 paragraphs or a reasonable amount of paragraph text
+    paragraphs = _PARAGRAPH_RE.findall(text)
+    if len(paragraphs) >= 2:
+        return True
+    text_content = _TAG_RE.sub(b"", b" ".join(paragraphs))
+    return len(text_content.strip()) > 100  # More lenient
 
 
+@lru_cache(maxsize=4096)
 def needs_javascript_domain(domain: str) -> bool:
     """Check if a domain typically needs JavaScript for content."""
-    # Common patterns for JS-heavy sites
-    js_patterns = [
-        "medium.com",
-        "substack.com",
-        "ghost.io",
-        "notion.site",
-        "vercel.app",
-        "netlify.app",
-        "firebase.app",
-        "web.app",
-    ]
-
-    return any(pattern in domain for pattern in js_patterns)
+    return domain in _JS_DOMAINS or domain.endswith(_JS_DOMAIN_SUFFIXES)
@@ -1,7 +1,7 @@
 import re
-from datetime import datetime
+from datetime import date
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from bs4.element import PageElement
 from markdownify import MarkdownConverter
 
@@ -29,15 +29,9 @@ class CustomMarkdownConverter(MarkdownConverter):
         return super().convert_li(*args, **kwargs).rstrip() + "\n"
 
 
-def html_to_markdown(html: bytes) -> str:
-    """
-    Converts HTML to Markdown, focusing on main content while removing navigation,
-    ads, and other non-essential elements.
-    """
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Remove non-content elements
-    unwanted_tags = [
+# Non-content elements removed from the article HTML, by tag name, class and ARIA role
+_UNWANTED_TAGS = frozenset(
+    {
         "head",
         "nav",
         "footer",
@@ -51,163 +45,200 @@ def html_to_markdown(html: bytes) -> str:
         "noscript",
         "svg",
         "path",
-        ".nav",
-        ".footer",
-        ".sidebar",
-        ".ads",
-        ".comments",
-        ".social-share",
-        ".related-posts",
-        ".subscription",
-        "[role='navigation']",
-        "[role='complementary']",
-    ]
-
-    # Remove by tag name and CSS selectors
-    for selector in unwanted_tags:
-        elements = soup.select(selector) if "." in selector or "[" in selector else soup.find_all(selector)
-        for element in elements:
-            if isinstance(element, Tag):
-                element.decompose()
-
-    # Use custom converter with proper spacing
-    md = CustomMarkdownConverter(
-        heading_style="ATX",
-        bullets="-",  # Standardize bullet points
-        autolinks=True,
-        convert=[
-            "h1",
-            "h2",
-            "h3",
-            "h4",
-            "h5",
-            "h6",
-            "p",
-            "a",
-            "b",
-            "strong",
-            "em",
-            "i",
-            "img",
-            "ul",
-            "ol",
-            "li",
-            "blockquote",
-            "code",
-            "pre",
-            "table",
-            "thead",
-            "tbody",
-            "tr",
-            "th",
-            "td",
-        ],
-    )
+    }
+)
+_UNWANTED_CLASSES = frozenset(
+    {
+        "nav",
+        "footer",
+        "sidebar",
+        "ads",
+        "comments",
+        "social-share",
+        "related-posts",
+        "subscription",
+    }
+)
+_UNWANTED_ROLES = frozenset({"navigation", "complementary"})
+
+
+def _is_unwanted(tag: Tag) -> bool:
+    """Match non-content elements with set lookups instead of CSS selector matching."""
+    if tag.name in _UNWANTED_TAGS or tag.get("role") in _UNWANTED_ROLES:
+        return True
+    classes = tag.get("class")
+    return classes is not None and not _UNWANTED_CLASSES.isdisjoint(classes)
+
+
+# Custom converter with proper spacing, shared by all calls to keep its conversion function cache warm
+_MARKDOWN_CONVERTER = CustomMarkdownConverter(
+    heading_style="ATX",
+    bullets="-",  # Standardize bullet points
+    autolinks=True,
+    convert=[
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "p",
+        "a",
+        "b",
+        "strong",
+        "em",
+        "i",
+        "img",
+        "ul",
+        "ol",
+        "li",
+        "blockquote",
+        "code",
+        "pre",
+        "table",
+        "thead",
+        "tbody",
+        "tr",
+        "th",
+        "td",
+    ],
+)
+
+
+def html_to_markdown(html: bytes) -> str:
+    """
+    Converts HTML to Markdown, focusing on main content while removing navigation,
+    ads, and other non-essential elements.
+    """
+    # Fetched articles are normalized to UTF-8, so skip charset detection and ignore stale <meta charset> tags
+    soup = BeautifulSoup(html, "lxml", from_encoding="utf-8")
+
+    # Remove non-content elements in a single pass over the tree
+    for element in soup.find_all(_is_unwanted):
+        # Descendants of an element removed earlier in the pass are already gone
+        if not element.decomposed:
+            element.decompose()
 
-    markdown = md.convert_soup(soup)
+    markdown = _MARKDOWN_CONVERTER.convert_soup(soup)
     return clean_markdown(markdown)
 
 
+# Lines dropped from the article markdown, removed together with their line break in a single pass over the text.
+# Whitespace is matched with [^\S\n] so that no pattern runs over into the next line.
+_SKIP_LINES_RE = re.compile(
+    "^(?:"
+    + "|".join(
+        [
+            # Social media and navigation patterns
+            r"[^\S\n]*(?i:Follow|Share|Like|Tweet|Subscribe|Sign up|Sign in|Log in|Register)",
+            # Social media links
+            r"[^\S\n]*\[(?:Facebook|Twitter|LinkedIn|Instagram|YouTube|GitHub|Pinterest)[^\]\n]*\]\(http[^\)\n]+\)",
+            # Social media links via URL
+            r"http[s]?://.*?(?:facebook|twitter|x|linkedin|instagram|youtube|github|pinterest|medium|substack)\.com",
+            # Relative links
+            r"[^\S\n]*\[.*\]\(/.*\)",
+            # Author and metadata
+            r"[^\S\n]*(?i:By|Published on|Written by|Author)",
+            # Reading time
+            r"[^\S\n]*(?i:\d+[^\S\n]*min(?:ute)?s?[^\S\n]*read)",
+            # Navigation links
+            r"[^\S\n]*-[^\S\n]*\[.*\]\(.*\)",
+            # Horizontal rules
+            r"[^\S\n]*[-—_]{3,}[^\S\n]*$",
+        ]
+    )
+    + r").*(?:\n|\Z)",
+    re.MULTILINE,
+)
+_BLANK_LINE_RE = re.compile(r"^[^\S\n]+$", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Empty links and images, unwrapping them can leave a line that the filters above drop, such as "[Follow me]()"
+_EMPTY_LINK_RE = re.compile(r"\[([^\]]*)\]\(\s*\)")
+_EMPTY_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(\s*\)")
+
+_CLEANUP_PATTERNS = [
+    # Remove empty headers
+    (re.compile(r"^#+\s*$", re.MULTILINE), ""),
+    # Normalize spaces after headers
+    (re.compile(r"(^#+.*)\n(?!\n)", re.MULTILINE), r"\1\n\n"),
+    # Normalize multiple newlines
+    (re.compile(r"\n{3,}"), "\n\n"),
+    # Clean up remaining whitespace, matching only from the start of a run to keep long runs linear
+    (re.compile(r"(?<![ \t])[ \t]+$", re.MULTILINE), ""),
+]
+
+
 def clean_markdown(markdown: str) -> str:
     """
     Cleans up the article markdown by removing unnecessary elements and standardizing format.
     """
-    # Split into lines for easier processing
-    lines = markdown.split("\n")
-    cleaned_lines = []
-    skip_next = False
-
-    for i, line in enumerate(lines):
-        if skip_next:
-            skip_next = False
-            continue
-
-        # Skip social media and navigation patterns
-        if re.match(r"\s*(?:Follow|Share|Like|Tweet|Subscribe|Sign up|Sign in|Log in|Register)", line, re.I):
-            continue
-
-        # Skip social media links
-        if re.match(r"\s*\[(Facebook|Twitter|LinkedIn|Instagram|YouTube|GitHub|Pinterest)[^\]]*\]\(http[^\)]+\)", line):
-            continue
-
-        # Skip social media links via URL
-        if re.match(
-            r"http[s]?://.*?(?:facebook|twitter|x|linkedin|instagram|youtube|github|pinterest|medium|substack)\.com",
-            line,
-        ):
-            continue
-
-        # Skip relative links
-        if re.match(r"\s*\[.*\]\(/.*\)", line):
-            continue
-
-        # Skip author and metadata
-        if re.match(r"\s*(?:By|Published on|Written by|Author)", line, re.I):
-            continue
-
-        # Skip reading time
-        if re.match(r"\s*(?:\d+\s*min(?:ute)?s?\s*read)", line, re.I):
-            continue
-
-        # Skip navigation links
-        if re.match(r"\s*-\s*\[.*\]\(.*\)", line):
-            continue
-
-        # Remove horizontal rules
-        if re.match(r"\s*[-—_]{3,}\s*$", line):
-            skip_next = False
-            continue
-
-        # Preserve content lines
-        if line.strip():
-            cleaned_lines.append(line)
-        elif cleaned_lines and cleaned_lines[-1].strip():
-            cleaned_lines.append("")
-
-    # Join lines and clean up
-    markdown = "\n".join(cleaned_lines)
-
-    # Final cleanup patterns
-    cleanup_patterns = [
-        # Remove empty links and their brackets
-        (r"\[([^\]]*)\]\(\s*\)", r"\1"),
-        # Remove empty images
-        (r"!\[([^\]]*)\]\(\s*\)", ""),
-        # Remove empty headers
-        (r"^#+\s*$", "", re.MULTILINE),
-        # Normalize spaces after headers
-        (r"(^#+.*)\n(?!\n)", r"\1\n\n", re.MULTILINE),
-        # Normalize multiple newlines
-        (r"\n{3,}", "\n\n"),
-        # Clean up remaining whitespace
-        (r"[ \t]+$", "", re.MULTILINE),
-    ]
-
-    for pattern, replacement, *flags in cleanup_patterns:
-        flag = flags[0] if flags else 0
-        markdown = re.sub(pattern, replacement, markdown, flags=flag)
-
-    return markdown.strip()
+    # Text exposed by removed links is filtered again, so a single call leaves nothing for another one to clean.
+    # Each pass unwraps one level of nested empty links, so this loops rather than recursing on deep nesting.
+    while True:
+        # Drop social media, navigation, metadata and horizontal rule lines
+        markdown = _SKIP_LINES_RE.sub("", markdown)
+
+        # Preserve content lines, keeping at most one blank line between them
+        markdown = _BLANK_LINE_RE.sub("", markdown)
+        markdown = _BLANK_LINES_RE.sub("\n\n", markdown).lstrip("\n")
+
+        # Remove empty links and their brackets, then empty images
+        markdown, unwrapped_links = _EMPTY_LINK_RE.subn(r"\1", markdown)
+        markdown, removed_images = _EMPTY_IMAGE_RE.subn("", markdown)
+
+        # Final cleanup patterns
+        for pattern, replacement in _CLEANUP_PATTERNS:
+            markdown = pattern.sub(replacement, markdown)
+
+        markdown = markdown.strip()
+        if not (unwrapped_links or removed_images):
+            return markdown
+
+
+# Navigation-like text, all alternatives evaluated in a single match
+_NAVIGATION_RE = re.compile(
+    r"^(?:menu\b|navigation\b|skip to\b|go to\b|search\b|home$|about$|contact\b|main menu\b)",
+    re.I,
+)
 
 
 def is_likely_navigation(text: str) -> bool:
     """
     Helper function to identify navigation-like content with more precise matching.
     """
-    nav_patterns = [
-        r"^menu\b",
-        r"^navigation\b",
-        r"^skip to\b",
-        r"^go to\b",
-        r"^search\b",
-        r"^home$",
-        r"^about$",
-        r"^contact\b",
-        r"^main menu\b",
-    ]
-    text_lower = text.lower()
     # More lenient matching for navigation patterns
-    return any(re.search(pattern, text_lower, re.I) for pattern in nav_patterns)
+    return _NAVIGATION_RE.match(text.lower()) is not None
+
+
+# Ordinal suffix of the day in issue dates, e.g. "1st", "22nd"
+_ORDINAL_SUFFIX_RE = re.compile(r"(\d+)(st|nd|rd|th)")
+
+# English month names of issue dates, looked up directly instead of through locale-aware strptime
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        "january february march april may june july august september october november december".split(), start=1
+    )
+}
+
+
+def _parse_issue_date(date_str: str) -> date:
+    """Parse an issue date in the "1 October 2023" format, raising ValueError if it doesn't match."""
+    day, month, year = date_str.split()
+    if month.lower() not in _MONTHS:
+        raise ValueError(f"Unknown month in issue date '{date_str}'")
+    return date(int(year), _MONTHS[month.lower()], int(day))
+
+
+# Issue index markup, matched with filters built once instead of on every find call
+_ISSUE_ELEMENT = SoupStrainer("div", class_="table-issue")
+_ISSUE_TITLE = SoupStrainer("p", class_="title-table-issue")
+_ISSUE_DATE = SoupStrainer("p", class_="text-table-issue")
+
+# Issue page markup
+_TOPIC_SECTION = SoupStrainer("h3", class_="topic-title")
+_ARTICLE_TITLE = SoupStrainer("a", class_="post-title")
 
 
 class SiteParser:
@@ -236,7 +267,7 @@ class SiteParser:
         Returns:
             List of PageElement objects representing individual issues
         """
-        return soup.find_all("div", class_="table-issue")
+        return soup.find_all(_ISSUE_ELEMENT)
 
     @staticmethod
     def parse_issue_element(element: PageElement, base_url: str, item_count: int, total_issues: int) -> Issue:
@@ -252,16 +283,16 @@ class SiteParser:
         Returns:
             Issue object with parsed metadata
         """
-        title_element = element.find("p", class_="title-table-issue")  # type: ignore
+        title_element = element.find(_ISSUE_TITLE)  # type: ignore
         link_element = title_element.find("a")
         issue_url = link_element["href"]
         issue_num = int(issue_url.split("/")[-1])
-        date_element = element.find("p", class_="text-table-issue")  # type: ignore
+        date_element = element.find(_ISSUE_DATE)  # type: ignore
         issue_date_str = date_element.get_text(strip=True)
 
         # Parse the date string
-        issue_date_str = re.sub(r"(\d+)(st|nd|rd|th)", r"\1", issue_date_str)
-        issue_date = datetime.strptime(issue_date_str, "%d %B %Y").date()
+        issue_date_str = _ORDINAL_SUFFIX_RE.sub(r"\1", issue_date_str)
+        issue_date = _parse_issue_date(issue_date_str)
 
         # Make the url absolute
         if not issue_url.startswith("http"):
@@ -288,7 +319,7 @@ class SiteParser:
         Returns:
             List of PageElement objects representing topic section headers
         """
-        return soup.find_all("h3", class_="topic-title")
+        return soup.find_all(_TOPIC_SECTION)
 
     @staticmethod
     def get_articles_for_section(section: PageElement, next_section: PageElement | None = None) -> list[PageElement]:
@@ -302,19 +333,11 @@ class SiteParser:
         Returns:
             List of PageElement objects representing article divs in this section
         """
-        next_siblings = list(section.next_siblings)
-
-        # Find the next topic section (if any)
-        next_section_index = None
-        if next_section:
-            try:
-                next_section_index = next_siblings.index(next_section)
-            except ValueError:
-                next_section_index = None
-
-        # Get divs until the next section (or end if it's the last section)
+        # Get divs until the next section (or end if it's the last section) in a single walk
         article_divs = []
-        for sibling in next_siblings[:next_section_index]:
+        for sibling in section.next_siblings:
+            if sibling is next_section:
+                break
             if isinstance(sibling, Tag) and sibling.name == "div":
                 article_divs.append(sibling)
 
@@ -331,12 +354,23 @@ class SiteParser:
         Returns:
             Total count of articles across all sections
         """
-        total_articles = 0
-        for i, section in enumerate(topic_sections):
-            next_section = topic_sections[i + 1] if i + 1 < len(topic_sections) else None
-            article_divs = SiteParser.get_articles_for_section(section, next_section)
-            total_articles += len(article_divs)
-        return total_articles
+        return sum(len(article_divs) for article_divs in SiteParser.get_articles_by_section(topic_sections))
+
+    @staticmethod
+    def get_articles_by_section(topic_sections: list[PageElement]) -> list[list[PageElement]]:
+        """
+        Get article divs for all topic sections in one pass over the issue page.
+
+        Args:
+            topic_sections: List of topic section PageElements
+
+        Returns:
+            List of article div lists, one per topic section
+        """
+        return [
+            SiteParser.get_articles_for_section(section, topic_sections[i + 1] if i + 1 < len(topic_sections) else None)
+            for i, section in enumerate(topic_sections)
+        ]
 
     @staticmethod
     def extract_article(div: PageElement, issue: Issue, item_count: int, total_articles: int) -> Article | None:
@@ -352,14 +386,19 @@ class SiteParser:
         Returns:
             Article object with parsed data, or None if parsing fails
         """
-        title_element = div.find("a", class_="post-title")  # type: ignore
+        title_element = div.find(_ARTICLE_TITLE)  # type: ignore
         if not title_element:
             return None
 
         article_url = title_element["href"]
         article_title = title_element.get_text(strip=True)
-        reading_time = SiteParser.extract_reading_time(div)
-        summary = SiteParser.extract_summary(div)
+        # Locate the reading time once, both the reading time and the summary are parsed from it
+        reading_time_element = SiteParser.find_reading_time_element(div)
+        if reading_time_element:
+            reading_time = SiteParser.extract_reading_time(div, reading_time_element)
+            summary = SiteParser.extract_summary(div, reading_time_element)
+        else:
+            reading_time, summary = 0, ""
 
         return Article(
             title=article_title,
@@ -372,21 +411,36 @@ class SiteParser:
         )
 
     @staticmethod
-    def extract_reading_time(div: PageElement) -> int:
+    def find_reading_time_element(div: PageElement) -> PageElement | None:
+        """
+        Find the reading time text in a div element.
+
+        Args:
+            div: PageElement containing article HTML structure
+
+        Returns:
+            Text element with the reading time, or None if not found
+        """
+        return div.find(string=lambda t: "minutes read" in t)  # type: ignore
+
+    @staticmethod
+    def extract_reading_time(div: PageElement, reading_time_element: PageElement | None = None) -> int:
         """
         Extract reading time from a div element.
 
         Args:
             div: PageElement containing article HTML structure
+            reading_time_element: Reading time text if already found, otherwise it is looked up in the div
 
         Returns:
             Reading time in minutes, or 0 if not found
         """
-        reading_time_element = div.find(string=lambda t: "minutes read" in t)  # type: ignore
-        return int(reading_time_element.split()[0]) if reading_time_element else 0
+        if reading_time_element is None:
+            reading_time_element = SiteParser.find_reading_time_element(div)
+        return int(reading_time_element.split()[0]) if reading_time_element else 0  # type: ignore
 
     @staticmethod
-    def extract_summary(div: PageElement) -> str:
+    def extract_summary(div: PageElement, reading_time_element: PageElement | None = None) -> str:
         """
         Extract summary text from a div element.
 
@@ -395,30 +449,30 @@ class SiteParser:
 
         Args:
             div: PageElement containing article HTML structure
+            reading_time_element: Reading time text if already found, otherwise it is looked up in the div
 
         Returns:
             Summary text, or empty string if not found
         """
-        reading_time_element = div.find(string=lambda t: "minutes read" in t)  # type: ignore
+        if reading_time_element is None:
+            reading_time_element = SiteParser.find_reading_time_element(div)
         if not reading_time_element:
             return ""
 
+        # Climb from the reading time text to the child of the div that contains it
+        reading_time_child = reading_time_element
+        while reading_time_child.parent is not div:
+            reading_time_child = reading_time_child.parent
+
         summary = ""
         br_count = 0
-        found_reading_time = False
 
-        # Iterate through all children of the div
-        for element in getattr(div, "children", []):
-            # Check if this element contains the reading time text
+        # Only the children after the reading time are part of the summary
+        for element in reading_time_child.next_siblings:
+            # Skip any further reading time indicators
             if hasattr(element, "strip") and "minutes read" in str(element):
-                found_reading_time = True
                 continue
             elif hasattr(element, "get_text") and "minutes read" in element.get_text():
-                found_reading_time = True
-                continue
-
-            # Only start collecting summary after we've found the reading time
-            if not found_reading_time:
                 continue
 
             # Handle BR tags
@@ -0,0 +1,6 @@
+"""Markers exchanged between the RAG flow and the chat UI.
+
+Kept free of dependencies, so that the UI can import them without loading the RAG components."""
+
+# Marks the end of a streamed chat response (a str, as Flyde loads each component from its own module copy)
+END_OF_RESPONSE = "\x04"
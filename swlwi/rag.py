@@ -2,16 +2,19 @@
 
 import os
 import sqlite3
+from functools import lru_cache
 
 import ollama
 from flyde.io import Input, InputMode, Output
 from flyde.node import Component, logger
 from langchain_community.vectorstores import SQLiteVec
 from langchain_core.documents import Document
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_openai import ChatOpenAI
 from langchain_text_splitters import MarkdownTextSplitter
 
+from swlwi.embeddings import get_embeddings
+from swlwi.protocol import END_OF_RESPONSE
+
 
 class ListArticles(Component):
     """Lists all articles in the index."""
@@ -21,17 +24,17 @@ class ListArticles(Component):
     outputs = {"article_path": Output(description="Stream of paths to articles", type=str)}
 
     def process(self, path: str) -> None:
-        for issue in os.listdir(path):
-            # Skip folders that don't start with 'issue-'
-            if not issue.startswith("issue-"):
-                continue
-            issue_path = os.path.join(path, issue)
-            for article in os.listdir(issue_path):
-                # Skip files that don't end with '.md'
-                if not article.endswith(".md"):
+        # scandir entries carry the file type from the directory listing, so no extra stat calls are needed
+        with os.scandir(path) as issues:
+            for issue in issues:
+                # Skip entries that aren't 'issue-' folders
+                if not issue.name.startswith("issue-") or not issue.is_dir():
                     continue
-                article_path = os.path.join(issue_path, article)
-                self.send("article_path", article_path)
+                with os.scandir(issue.path) as articles:
+                    for article in articles:
+                        # Skip files that don't end with '.md'
+                        if article.name.endswith(".md"):
+                            self.send("article_path", article.path)
         # Send EOF when finished listing
         logger.info("Finished listing articles")
         self.stop()
@@ -49,8 +52,8 @@ class DocumentLoader(Component):
         with open(path, "r") as f:
             text = f.read()
 
-        # Parse header
-        header = text.split("\n---\n")[0]
+        # Parse header, only the text before the first separator is scanned and split into lines
+        header = text.partition("\n---\n")[0]
         lines = header.split("\n")
         title = lines[0].strip("# \t\r\n")
         lines = lines[1:]
@@ -82,6 +85,12 @@ class DocumentLoader(Component):
         return {"document": doc}
 
 
+@lru_cache(maxsize=8)
+def _get_splitter(chunk_size: int) -> MarkdownTextSplitter:
+    """Splitters only hold their settings and compiled separators, so one is reused per chunk size."""
+    return MarkdownTextSplitter(chunk_size=chunk_size, chunk_overlap=50)
+
+
 class DocumentSplitter(Component):
     """Splits markdown documents into chunks."""
 
@@ -93,7 +102,7 @@ class DocumentSplitter(Component):
     outputs = {"documents": Output(description="Chunks of text")}
 
     def process(self, document: Document, chunk_size: int) -> dict[str, list[Document]]:
-        splitter = MarkdownTextSplitter(chunk_size=chunk_size, chunk_overlap=50)
+        splitter = _get_splitter(chunk_size)
         texts = [document.page_content]
         metadatas = [document.metadata]
         documents = splitter.create_documents(texts, metadatas)
@@ -101,6 +110,15 @@ class DocumentSplitter(Component):
         return {"documents": documents}
 
 
+# SQLite settings for the vector store: no rollback journal fsync per transaction and a 64 MB page cache
+_BULK_INSERT_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA cache_size=-65536;
+PRAGMA temp_store=MEMORY;
+"""
+
+
 class VectorStore(Component):
     """Stores documents as vectors in a vector store."""
 
@@ -109,30 +127,70 @@ class VectorStore(Component):
         "path": Input(description="Path to the vector store", type=str, mode=InputMode.STICKY, value="./index/vectors"),
     }
 
+    # Chunks embedded and inserted together, so that the model runs on full batches instead of one article at a time
+    batch_size = 256
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._buffer: list[Document] = []
+
     def _init(self, path: str):
         if not hasattr(self, "_embeddings"):
-            logger.info("Loading embeddings")
-            self._embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+            self._embeddings = get_embeddings()
         if not hasattr(self, "_vector_store"):
             logger.info("Creating vector store")
             # Create path if not exists
             os.makedirs(path, exist_ok=True)
+            db_file = f"{path}/db.sqlite3"
+            self._connection = SQLiteVec.create_connection(db_file)
+            # Tune the database for bulk inserts, WAL also lets the retriever read while indexing
+            self._connection.executescript(_BULK_INSERT_PRAGMAS)
             self._vector_store = SQLiteVec(
-                table="swlwi_embeddings", connection=None, db_file=f"{path}/db.sqlite3", embedding=self._embeddings
+                table="swlwi_embeddings", connection=self._connection, db_file=db_file, embedding=self._embeddings
             )
 
     def process(self, documents: list, path: str):
         logger.info(f"VectorStore Processing {len(documents)} documents")
         self._init(path)
-        logger.info(f"Adding {len(documents)} documents from {documents[0].metadata['path']} to the vector store")
+        logger.info(f"Buffering {len(documents)} documents from {documents[0].metadata['path']} for the vector store")
+        self._buffer.extend(documents)
+        if len(self._buffer) >= self.batch_size:
+            self._flush()
+
+    def finish(self):
+        # Store the last partial batch before signalling EOF downstream
+        try:
+            if self._buffer:
+                self._flush()
+        finally:
+            super().finish()
+
+    def _flush(self):
+        logger.info(f"Adding {len(self._buffer)} documents to the vector store")
+        if not self._add_documents(self._buffer):
+            # A single duplicate fails the whole batch, so store it article by article to only skip the duplicates
+            logger.info("Some documents already exist in the vector store, adding the batch article by article")
+            articles: dict[str, list[Document]] = {}
+            for document in self._buffer:
+                articles.setdefault(document.metadata.get("path"), []).append(document)
+            for path, documents in articles.items():
+                if not self._add_documents(documents):
+                    logger.info(f"Documents from {path} already exist in the vector store, skipping them")
+        # Only dropped once stored, other errors leave the batch in place
+        self._buffer = []
+
+    def _add_documents(self, documents: list[Document]) -> bool:
+        """Add documents to the vector store, returning False if some of them already exist."""
         try:
             self._vector_store.add_documents(documents)
+            return True
         except sqlite3.OperationalError as e:
-            if "UNIQUE constraint failed" in str(e):
-                logger.info("Some documents already exist in the vector store, skipping duplicates")
-            else:
+            if "UNIQUE constraint failed" not in str(e):
                 # Re-raise if it's a different error
                 raise
+            # Discard the rows inserted before the failing one, so that a later commit doesn't store them
+            self._connection.rollback()
+            return False
 
 
 class Retriever(Component):
@@ -147,7 +205,7 @@ class Retriever(Component):
 
     def _init(self, path: str):
         if not hasattr(self, "_embeddings"):
-            self._embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+            self._embeddings = get_embeddings()
         if not hasattr(self, "_vector_store"):
             logger.info(f"Opening vector store with path {path}/db.sqlite")
             self._vector_store = SQLiteVec(
@@ -178,9 +236,9 @@ class OllamaChat(Component):
         "context": Input(description="Context text", type=str),
     }
 
-    outputs = {"response": Output(description="Response from the Ollama model", type=str)}
+    outputs = {"response": Output(description="Stream of response tokens from the Ollama model", type=str)}
 
-    def process(self, query: str, context: str) -> dict[str, str]:
+    def process(self, query: str, context: str) -> None:
         logger.info(f"Loaded context:\n\n {context}\n\n")
 
         # System prompt tells the agent about their role and sets ground rules
@@ -201,12 +259,17 @@ Question: {query}
 
 Please answer the question based primarily on the provided context"""
 
-        # Invoke the model
-        response = ollama.chat(
+        # Invoke the model and stream the tokens as they are generated
+        stream = ollama.chat(
             model="llama3.2",  # Replace this with other model string if needed, e.g. "phi4"
             messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": prompt}],
+            stream=True,
         )
-        return {"response": response["message"]["content"]}
+        for chunk in stream:
+            token = chunk["message"]["content"]
+            if token:
+                self.send("response", token)
+        self.send("response", END_OF_RESPONSE)
 
 
 class OpenAIChat(Component):
@@ -217,13 +280,13 @@ class OpenAIChat(Component):
         "context": Input(description="Context text", type=str),
     }
 
-    outputs = {"response": Output(description="Response from the OpenAI model", type=str)}
+    outputs = {"response": Output(description="Stream of response tokens from the OpenAI model", type=str)}
 
     def _init(self):
         if not hasattr(self, "_llm"):
             self._llm = ChatOpenAI(model="gpt-4o")
 
-    def process(self, query: str, context: str) -> dict[str, str]:
+    def process(self, query: str, context: str) -> None:
         logger.info(f"Loaded context:\n\n {context}\n\n")
 
         # Load the model if needed
@@ -246,7 +309,8 @@ Question: {query}
 
 Please answer the question based primarily on the provided context"""
 
-        # Invoke the model
-        response = self._llm.invoke([("system", system_prompt), ("human", prompt)])
-
-        return {"response": response.content}  # type: ignore
+        # Invoke the model and stream the tokens as they are generated
+        for chunk in self._llm.stream([("system", system_prompt), ("human", prompt)]):
+            if chunk.content:
+                self.send("response", chunk.content)
+        self.send("response", END_OF_RESPONSE)
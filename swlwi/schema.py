@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """Represents a newsletter issue"""
 
@@ -14,7 +14,7 @@ class Issue:
     item_of: tuple[int, int] = (0, 0)  # (current, total)
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Represents an article within an issue"""
 
@@ -1,9 +1,13 @@
 """Components for scraping the SWLW issues and their contents."""
 
+import heapq
+import itertools
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
 from bs4 import BeautifulSoup
 from flyde.io import Input, InputMode, Output, Requiredness
 from flyde.node import Component
@@ -18,7 +22,6 @@ from swlwi.net import (
 )
 from swlwi.parser import (
     SiteParser,
-    clean_markdown,
     html_to_markdown,
 )
 from swlwi.schema import Article, Issue
@@ -40,14 +43,18 @@ class ListIssues(Component):
         "issue": Output(description="List of issues", type=Issue),
     }
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.http_client = HTTPClient()
+
     def process(self, url: str, limit: int):
         logger.debug(f"Fetching the index page at {url}")
 
-        # Get the page content using the requests library
-        response = requests.get(url)
+        # Get the page content over the pooled keep-alive session
+        response = self.http_client.get(url, use_rate_limiting=False, timeout=10)
 
         # Parse the HTML content using BeautifulSoup
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(response.content, "lxml")
         issue_elements = SiteParser.find_issue_elements(soup)
         total_issues = len(issue_elements)
         item_count = 0
@@ -115,34 +122,64 @@ class ExtractArticles(Component):
         "article": Output(description="Article", type=Article),
     }
 
+    # Issue pages fetched and parsed concurrently, they are all on the same host so this is kept small
+    max_workers = 4
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Issue pages are all on the same host, so the session keeps reusing its connections
+        self.http_client = HTTPClient()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="extract-articles")
+        self._send_lock = threading.Lock()
+
     def process(self, issue: Issue):
+        # Fetch the next issues while this one is being downloaded and parsed
+        self._executor.submit(self._extract_and_send, issue)
+
+    def finish(self):
+        # Wait for the issues in flight before EOF is sent downstream
+        self._executor.shutdown(wait=True)
+        super().finish()
+
+    def _extract_and_send(self, issue: Issue):
+        try:
+            articles = self.extract(issue)
+        except Exception as e:
+            logger.error(f"Failed to extract articles from issue #{issue.num} at {issue.url}: {e}")
+            return
+
+        # Articles of an issue are sent together and in page order
+        with self._send_lock:
+            for article in articles:
+                self.send("article", article)
+
+    def extract(self, issue: Issue) -> list[Article]:
+        """Fetch the issue page and return the articles listed in it."""
         logger.debug(f"Fetching issue #{issue.num} at {issue.url}")
 
         # Get the page content and parse it
-        response = requests.get(issue.url)
-        soup = BeautifulSoup(response.content, "html.parser")
+        response = self.http_client.get(issue.url, use_rate_limiting=False, timeout=10)
+        soup = BeautifulSoup(response.content, "lxml")
 
         # Find the topic sections
         topic_sections = SiteParser.find_topic_sections(soup)
-        # Count the total number of articles across all sections
-        total_articles = SiteParser.count_total_articles(topic_sections)
+        # Collect the articles of each section once, then count them from the collected lists
+        articles_by_section = SiteParser.get_articles_by_section(topic_sections)
+        total_articles = sum(len(article_divs) for article_divs in articles_by_section)
         logger.debug(f"Found {total_articles} articles in issue #{issue.num}")
 
         # Loop through each topic section and extract articles
-        item_count = 0
-        for i, section in enumerate(topic_sections):
-            next_section = topic_sections[i + 1] if i + 1 < len(topic_sections) else None
-            article_divs = SiteParser.get_articles_for_section(section, next_section)
-
+        articles = []
+        for article_divs in articles_by_section:
             for div in article_divs:
-                article = SiteParser.extract_article(div, issue, item_count, total_articles)
+                article = SiteParser.extract_article(div, issue, len(articles), total_articles)
                 if article:
                     logger.info(
                         f"Found article '{article.title}' at {article.url} in issue #{issue.num}. Reading time: {article.reading_time} minutes."
                     )
                     logger.debug(f"Summary:\n{article.summary}")
-                    self.send("article", article)
-                    item_count += 1
+                    articles.append(article)
+        return articles
 
 
 class FetchArticle(Component):
@@ -157,11 +194,89 @@ class FetchArticle(Component):
         "needs_javascript": Output(description="Article that needs JavaScript to fetch", type=Article),
     }
 
+    # Articles fetched concurrently, requests to the same domain are still spaced by the shared rate limiter
+    max_workers = 8
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.http_client = HTTPClient()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fetch-article")
+        self._send_lock = threading.Lock()
+        # Articles waiting for their domain's rate limiting slot, as (due time, sequence, article)
+        self._scheduled: list[tuple[float, int, Article]] = []
+        self._sequence = itertools.count()
+        self._schedule_cond = threading.Condition()
+        self._scheduler: threading.Thread | None = None
+        self._finishing = False
+
+    def process(self, article: Article):
+        # Fetch in the background, so that one slow site doesn't hold up the articles queued behind it.
+        # The rate limiting slot is reserved here and the fetch only starts once it is due, so pool workers
+        # never sleep in the rate limiter while articles from other domains wait behind them. Cached responses
+        # don't reach the server, so they don't take a slot.
+        domain = extract_domain_from_url(article.url)
+        if should_skip_domain(domain) or self.http_client.is_cached(article.url):
+            delay = 0.0
+        else:
+            delay = self.http_client.rate_limiter.reserve(domain)
+        if delay > 0:
+            self._schedule(article, delay)
+        else:
+            self._executor.submit(self._fetch_and_send, article)
+
+    def finish(self):
+        # Let the scheduled articles start, then wait for the fetches in flight before EOF is sent downstream
+        with self._schedule_cond:
+            self._finishing = True
+            self._schedule_cond.notify()
+        if self._scheduler is not None:
+            self._scheduler.join()
+        self._executor.shutdown(wait=True)
+        super().finish()
+
+    def _schedule(self, article: Article, delay: float):
+        with self._schedule_cond:
+            heapq.heappush(self._scheduled, (time.monotonic() + delay, next(self._sequence), article))
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(
+                    target=self._run_scheduler, name="fetch-article-scheduler", daemon=True
+                )
+                self._scheduler.start()
+            self._schedule_cond.notify()
+
+    def _run_scheduler(self):
+        """Submit the scheduled articles to the pool as their rate limiting slots come due."""
+        with self._schedule_cond:
+            while self._scheduled or not self._finishing:
+                if not self._scheduled:
+                    self._schedule_cond.wait()
+                    continue
+                delay = self._scheduled[0][0] - time.monotonic()
+                if delay > 0:
+                    # Woken up early when an article with an earlier slot is scheduled
+                    self._schedule_cond.wait(delay)
+                    continue
+                _, _, article = heapq.heappop(self._scheduled)
+                self._executor.submit(self._fetch_and_send, article)
+
+    def _fetch_and_send(self, article: Article):
+        try:
+            result = self.fetch(article)
+        except Exception as e:
+            logger.error(f"Failed to fetch article '{article.title}' at {article.url}: {e}")
+            result = {"needs_javascript": article}
 
-    def process(self, article: Article) -> dict[str, Article]:
+        with self._send_lock:
+            for output, value in result.items():
+                if self.outputs[output].connected:
+                    self.send(output, value)
+
+    def fetch(self, article: Article) -> dict[str, Article]:
+        """
+        Fetch the article over HTTP and return it on the output it should be sent to.
+
+        The domain's rate limiting slot is reserved by process() before this runs.
+        """
         domain = extract_domain_from_url(article.url)
 
         if should_skip_domain(domain):
@@ -169,7 +284,7 @@ class FetchArticle(Component):
 
         # Try HTTP first regardless of domain - let content analysis decide
         try:
-            response = self.http_client.get(article.url, timeout=10)
+            response = self.http_client.get(article.url, use_rate_limiting=False, timeout=10)
 
             # Check for various protection/JS requirements
             if self.http_client.is_cloudflare_protected(response):
@@ -180,9 +295,9 @@ class FetchArticle(Component):
                 logger.debug(f"Article '{article.title}' at {article.url} needs JavaScript based on content ")
                 return {"needs_javascript": article}
 
-            # Additional content quality check
+            # Additional content quality check, only needed if decoding changed the content analyzed above
             decoded_content = self.http_client.decode_response_content(response)
-            if not has_meaningful_content(decoded_content):
+            if decoded_content is not response.content and not has_meaningful_content(decoded_content):
                 logger.debug(f"Article '{article.title}' at {article.url} has poor content quality")
                 return {"needs_javascript": article}
 
@@ -212,8 +327,12 @@ class FetchArticleWithJavaScript(Component):
         "article": Output(description="Article with content", type=Article),
     }
 
+    # Articles fetched together, so that the browser loads several pages at a time
+    batch_size = 8
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self._batch: list[Article] = []
         try:
             self.browser_client = BrowserClient()
             logger.info("Browser client initialized successfully for JavaScript fetching")
@@ -221,37 +340,53 @@ class FetchArticleWithJavaScript(Component):
             logger.error(f"Failed to initialize browser client: {e}")
             self.browser_client = None
 
-    def process(self, article: Article) -> dict[str, Article]:
-        logger.info(f"Starting browser fetch for '{article.title}' at {article.url}")
-
-        # Check if browser client is available
-        if not self.browser_client:
-            logger.error(f"Browser client not available for '{article.title}'")
-            article.html = b""
-            return {"article": article}
+    def process(self, article: Article):
+        self._batch.append(article)
+        if len(self._batch) >= self.batch_size:
+            self._fetch_batch()
 
+    def finish(self):
+        # Playwright must be shut down from the thread that used it, which is this component's worker
         try:
-            # Add timeout to prevent hanging - use shorter timeout for faster failure
-            html_content = self.browser_client.fetch(article.url, timeout=10000)  # 10 seconds
+            if self._batch:
+                self._fetch_batch()
+        finally:
+            if self.browser_client:
+                self.browser_client.close()
+            super().finish()
+
+    def _fetch_batch(self):
+        articles, self._batch = self._batch, []
+        for article in articles:
+            logger.info(f"Starting browser fetch for '{article.title}' at {article.url}")
 
+        # Check if browser client is available
+        if not self.browser_client:
+            logger.error(f"Browser client not available for {len(articles)} articles")
+            contents: list[bytes | None] = [None] * len(articles)
+        else:
+            try:
+                # Add timeout to prevent hanging - 10 seconds per page for faster failure
+                contents = self.browser_client.fetch_many([article.url for article in articles], timeout=10000)
+            except Exception as e:
+                logger.error(f"Failed to fetch {len(articles)} articles with Playwright: {e}")
+                logger.debug(f"Exception type: {type(e).__name__}")
+                contents = [None] * len(articles)
+
+        for article, html_content in zip(articles, contents):
             if html_content:
                 article.html = html_content
                 logger.info(
                     f"Successfully fetched article '{article.title}' at {article.url} with Playwright ({len(html_content)} bytes)"
                 )
             else:
-                logger.warning(f"Browser returned no content for '{article.title}'L")
+                logger.warning(f"Browser returned no content for '{article.title}'")
                 # Continue processing even if no content - don't block the pipeline
                 article.html = b""
 
-        except Exception as e:
-            logger.error(f"Failed to fetch article '{article.title}' at {article.url}: {e}")
-            logger.debug(f"Exception type: {type(e).__name__}")
-            # Set empty HTML to ensure pipeline continues
-            article.html = b""
-
-        logger.info(f"Completed browser fetch for '{article.title}'")
-        return {"article": article}
+            logger.info(f"Completed browser fetch for '{article.title}'")
+            if self.outputs["article"].connected:
+                self.send("article", article)
 
 
 class ExtractArticleContent(Component):
@@ -270,13 +405,13 @@ class ExtractArticleContent(Component):
             logger.warning(f"No HTML content found for article '{article.title}' at {article.url}")
             return {"article": article}
 
+        # Converted Markdown comes out already cleaned up
         markdown = html_to_markdown(article.html)
 
-        # Clean up the Markdown content
-        markdown = clean_markdown(markdown)
-
         # Update the article with the Markdown content only if we have content
         article.markdown = markdown
+        # The raw HTML is not used past this point, don't hold it in the downstream queues
+        article.html = b""
 
         # Return the article - always continue the pipeline
         return {"article": article}
@@ -290,10 +425,16 @@ class SaveArticle(Component):
         "path": Input(description="Path prefix to save the article", type=str, mode=InputMode.STICKY),  # type: ignore
     }
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._created_dirs: set[str] = set()
+
     def process(self, article: Article, path: str):
-        # Save the article to a file
+        # Save the article to a file, articles of the same issue share a directory that only needs creating once
         dir_name = f"{path}/issue-{article.issue_num}"
-        os.makedirs(dir_name, exist_ok=True)
+        if dir_name not in self._created_dirs:
+            os.makedirs(dir_name, exist_ok=True)
+            self._created_dirs.add(dir_name)
         filename = f"{dir_name}/article-{article.item_of[0]}.md"
 
         logger.info(f"Saving article '{article.title}' to {filename}")
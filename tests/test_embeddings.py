@@ -0,0 +1,36 @@
+import unittest
+from unittest.mock import patch
+
+from swlwi.embeddings import _load_embeddings, get_embeddings
+
+
+class TestGetEmbeddings(unittest.TestCase):
+    def setUp(self):
+        _load_embeddings.cache_clear()
+
+    def tearDown(self):
+        _load_embeddings.cache_clear()
+
+    @patch("swlwi.embeddings.HuggingFaceEmbeddings")
+    def test_model_is_loaded_once_per_name(self, mock_embeddings):
+        first = get_embeddings()
+        second = get_embeddings("all-MiniLM-L6-v2")
+        other = get_embeddings("other-model")
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_embeddings.call_count, 2)
+        mock_embeddings.assert_any_call(model_name="all-MiniLM-L6-v2")
+        mock_embeddings.assert_any_call(model_name="other-model")
+        self.assertIsNotNone(other)
+
+    @patch.dict("os.environ", {"EMBEDDINGS_BACKEND": "onnx"})
+    @patch("swlwi.embeddings.HuggingFaceEmbeddings")
+    def test_onnx_backend(self, mock_embeddings):
+        get_embeddings()
+
+        _, kwargs = mock_embeddings.call_args
+        self.assertEqual(kwargs["model_kwargs"]["backend"], "onnx")
+
+
+if __name__ == "__main__":
+    unittest.main()
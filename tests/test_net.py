@@ -1,6 +1,21 @@
+import asyncio
+import os
 import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from swlwi.net import extract_domain_from_url
+import requests
+
+from swlwi.net import (
+    DEFAULT_RATE_LIMITER,
+    BrowserClient,
+    HTTPClient,
+    RateLimiter,
+    analyze_response_quality,
+    extract_domain_from_url,
+    get_content_type_from_response,
+    has_meaningful_content,
+    is_content_blocked,
+)
 
 
 class TestExtractDomainFromUrl(unittest.TestCase):
@@ -55,6 +70,280 @@ class TestExtractDomainFromUrl(unittest.TestCase):
         self.assertEqual(extract_domain_from_url(url), expected_domain)
 
 
+class TestHTTPClientSession(unittest.TestCase):
+    @patch.dict(os.environ, {"HTTP_CACHE": ""})
+    def test_uncached_session_by_default(self):
+        self.assertIs(type(HTTPClient().session), requests.Session)
+
+    def test_gateway_errors_are_returned_after_retries(self):
+        retries = HTTPClient().session.get_adapter("https://example.com").max_retries
+        self.assertEqual(2, retries.total)
+        self.assertFalse(retries.raise_on_status)
+
+    @patch("requests.Session.get")
+    def test_cached_responses_skip_rate_limiting(self, mock_get):
+        client = HTTPClient(rate_limiter=MagicMock())
+        client.session.cache = MagicMock()
+        client.session.cache.contains.side_effect = lambda url: url == "https://example.com/cached"
+        client.session.cache.get_response.return_value.is_expired = False
+
+        client.get("https://example.com/cached")
+        client.rate_limiter.wait.assert_not_called()
+
+        client.get("https://example.com/new")
+        client.rate_limiter.wait.assert_called_once_with("example.com")
+
+        client.session.cache.contains.side_effect = None
+        client.session.cache.get_response.return_value.is_expired = True
+        self.assertFalse(client.is_cached("https://example.com/cached"))
+
+
+class TestHTTPClientGetManyAsync(unittest.TestCase):
+    @patch("requests.Session.get")
+    def test_get_many_async(self, mock_get):
+        def fake_get(url, **kwargs):
+            if "broken" in url:
+                raise requests.ConnectionError("connection refused")
+            response = MagicMock()
+            response.url = url
+            return response
+
+        mock_get.side_effect = fake_get
+        urls = ["https://one.example.org/a", "https://broken.example.net/c", "https://two.example.org/b"]
+
+        results = asyncio.run(HTTPClient().get_many_async(urls, use_rate_limiting=False))
+
+        self.assertEqual(urls, [url for url, _ in results])
+        self.assertEqual("https://one.example.org/a", results[0][1].url)
+        self.assertIsInstance(results[1][1], requests.ConnectionError)
+        self.assertEqual("https://two.example.org/b", results[2][1].url)
+
+
+class TestBrowserClientFetchMany(unittest.TestCase):
+    def setUp(self):
+        BrowserClient._instance = None
+        BrowserClient._initialized = False
+        self.client = BrowserClient(rate_limiter=MagicMock())
+        self.client._browser = MagicMock()
+        self.client._context = MagicMock()
+        self.client._context.new_page.side_effect = lambda: MagicMock()
+
+    def tearDown(self):
+        self.client.close()
+        BrowserClient._instance = None
+        BrowserClient._initialized = False
+
+    def test_fetch_many_navigates_batch_before_reading(self):
+        calls = []
+
+        def fake_navigate(slot, url, timeout):
+            calls.append(("navigate", url))
+            return None if "broken" in url else (MagicMock(), MagicMock())
+
+        def fake_read_page(url, page, response, content_timeout):
+            calls.append(("read", url))
+            return url.encode()
+
+        urls = [f"https://example{i}.org/" for i in range(5)] + ["https://broken.example.net/"]
+        with (
+            patch.object(self.client, "_navigate", side_effect=fake_navigate),
+            patch.object(self.client, "_read_page", side_effect=fake_read_page),
+        ):
+            results = self.client.fetch_many(urls)
+
+        self.assertEqual([url.encode() for url in urls[:5]] + [None], results)
+        # The first batch fills all the pages before any of them is read
+        self.assertEqual([("navigate", url) for url in urls[:4]], calls[:4])
+        self.assertNotIn(("read", "https://broken.example.net/"), calls)
+
+    def test_content_wait_is_opt_in(self):
+        for content_timeout, expected_waits in [(0, 0), (1500, 1)]:
+            with self.subTest(content_timeout=content_timeout):
+                page = MagicMock()
+                page.content.return_value = "<html></html>"
+                response = MagicMock(status=200)
+
+                html = self.client._read_page("https://example.org/", page, response, content_timeout=content_timeout)
+
+                self.assertEqual(b"<html></html>", html)
+                self.assertEqual(expected_waits, page.wait_for_function.call_count)
+                if expected_waits:
+                    self.assertEqual(1500, page.wait_for_function.call_args.kwargs["timeout"])
+
+    def test_pages_are_kept_per_slot(self):
+        first = self.client._acquire_page(0)
+        second = self.client._acquire_page(1)
+
+        self.assertIsNot(first, second)
+        self.assertIs(first, self.client._acquire_page(0))
+        self.assertEqual([2, 1, 0, 0], self.client._page_uses)
+
+
+class TestDecodeResponseContent(unittest.TestCase):
+    def make_response(self, content, encoding=None):
+        response = MagicMock()
+        response.content = content
+        response.encoding = encoding
+        return response
+
+    @patch("swlwi.net.from_bytes")
+    def test_ascii_content_skips_detection(self, mock_detect):
+        content = b"<html><body>Plain ASCII</body></html>"
+        result = HTTPClient().decode_response_content(self.make_response(content, "ISO-8859-1"))
+        self.assertEqual(content, result)
+        mock_detect.assert_not_called()
+
+    def test_utf8_content_is_returned_as_is(self):
+        for encoding in ["utf-8", "UTF8"]:
+            for content in [b"<p>Plain ASCII</p>", "<p>Caf\u00e9</p>".encode("utf-8")]:
+                with self.subTest(encoding=encoding, content=content):
+                    result = HTTPClient().decode_response_content(self.make_response(content, encoding))
+                    self.assertIs(content, result)
+
+    @patch("swlwi.net.from_bytes")
+    def test_detection_uses_bounded_sample(self, mock_detect):
+        mock_detect.return_value.best.return_value = MagicMock(encoding="windows-1252", chaos=0.0)
+        content = "<p>Caf\u00e9</p>".encode("windows-1252") * 2000
+        result = HTTPClient().decode_response_content(self.make_response(content))
+        self.assertEqual(content.decode("windows-1252").encode("utf-8"), result)
+        self.assertLessEqual(len(mock_detect.call_args[0][0]), 2048)
+
+    @patch("swlwi.net.from_bytes")
+    def test_bom_and_declared_charset_skip_detection(self, mock_detect):
+        test_cases = [
+            ("\ufeff<p>Caf\u00e9</p>".encode("utf-8"), "<p>Caf\u00e9</p>"),
+            ("<p>Caf\u00e9</p>".encode("utf-16"), "<p>Caf\u00e9</p>"),
+            (
+                '<meta charset="windows-1251"><p>\u041f\u0440\u0438\u0432\u0435\u0442</p>'.encode("windows-1251"),
+                '<meta charset="windows-1251"><p>\u041f\u0440\u0438\u0432\u0435\u0442</p>',
+            ),
+        ]
+        for content, expected in test_cases:
+            with self.subTest(expected=expected):
+                result = HTTPClient().decode_response_content(self.make_response(content))
+                self.assertEqual(expected, result.decode("utf-8"))
+        mock_detect.assert_not_called()
+
+
+class TestIsCloudflareProtected(unittest.TestCase):
+    def make_response(self, content, status_code=200, headers=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.content = content
+        return response
+
+    def test_is_cloudflare_protected(self):
+        client = HTTPClient()
+        self.assertTrue(client.is_cloudflare_protected(self.make_response(b"", status_code=503)))
+        self.assertTrue(client.is_cloudflare_protected(self.make_response(b"", headers={"cf-ray": "123"})))
+        self.assertTrue(
+            client.is_cloudflare_protected(self.make_response(b"<p>Checking your BROWSER before accessing</p>"))
+        )
+        self.assertFalse(client.is_cloudflare_protected(self.make_response(b"<p>Regular article</p>")))
+
+
+class TestContentAnalysis(unittest.TestCase):
+    article_html = (
+        b"<!DOCTYPE html><html><head><title>Article</title></head><body><article>"
+        b"<p>This is a meaningful paragraph with enough content to pass the content quality checks easily.</p>"
+        b"<p>This is another meaningful paragraph that adds to the article content and its overall length.</p>"
+        b"</article></body></html>"
+    )
+
+    def test_is_content_blocked(self):
+        self.assertTrue(is_content_blocked(b"<h1>Access Denied</h1>"))
+        self.assertTrue(is_content_blocked("<p>Subscription required \u2014 paywall</p>".encode()))
+        self.assertFalse(is_content_blocked(self.article_html))
+
+    def test_has_meaningful_content(self):
+        self.assertTrue(has_meaningful_content(self.article_html))
+        self.assertFalse(has_meaningful_content(b"<html><body>Too short</body></html>"))
+        self.assertFalse(has_meaningful_content(b"<div>" + b"x" * 300 + b"</div>"))
+        # Paragraph text with inline markup counts, <pre> is not a paragraph
+        linked = b"<p>" + b"Some words " * 20 + b'<a href="/more">a link</a> and the rest.</p>'
+        self.assertTrue(has_meaningful_content(b"<html><body>" + linked + b"</body></html>"))
+        self.assertFalse(has_meaningful_content(b"<html><body><pre>" + b"x" * 300 + b"</pre></body></html>"))
+
+    def test_has_meaningful_content_with_unclosed_paragraphs(self):
+        unclosed = b"<html><body>" + b"<p>Some words <b>in bold</b> " * 20000 + b"</body></html>"
+        self.assertFalse(has_meaningful_content(unclosed))
+        # A closed paragraph after unclosed ones still counts
+        closed = b"<p>" + b"Some words " * 20 + b"and the rest.</p>"
+        self.assertTrue(has_meaningful_content(b"<html><body><p>Intro <p>More" + closed + b"</body></html>"))
+
+    def test_analyze_response_quality(self):
+        analysis = analyze_response_quality(self.article_html)
+        self.assertTrue(analysis["has_html_structure"])
+        self.assertTrue(analysis["has_article_content"])
+        self.assertFalse(analysis["is_blocked"])
+        self.assertFalse(analysis["needs_javascript"])
+
+        self.assertTrue(analysis["has_meaningful_content"])
+
+        analysis = analyze_response_quality(b"<html><body><NoScript>Please enable JavaScript</noscript></body></html>")
+        self.assertTrue(analysis["needs_javascript"])
+        self.assertFalse(analysis["has_article_content"])
+
+    def test_js_indicator_gap_is_bounded(self):
+        # The words of an indicator must be at most 100 bytes apart, further apart they are unrelated text
+        for gap, expected in [(100, True), (101, False)]:
+            with self.subTest(gap=gap):
+                html = self.article_html.replace(b"</article>", b"<p>enable" + b"x" * gap + b"javascript</p></article>")
+                self.assertEqual(expected, analyze_response_quality(html)["needs_javascript"])
+
+    def test_get_content_type_from_response(self):
+        test_cases = [
+            ({"content-type": "text/html; charset=UTF-8"}, b"", "text/html"),
+            ({}, b"<!DOCTYPE HTML><html></html>", "text/html"),
+            ({}, b'{"key": "value"}', "application/json"),
+            ({}, b"<?xml version='1.0'?><root/>", "application/xml"),
+            ({}, b"plain text", "text/plain"),
+        ]
+        for headers, content, expected in test_cases:
+            with self.subTest(expected=expected, content=content):
+                response = MagicMock()
+                response.headers = headers
+                response.content = content
+                self.assertEqual(expected, get_content_type_from_response(response))
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.rate_limiter = RateLimiter(timeout=1)
+
+    def test_default_rate_limiter_is_shared(self):
+        self.assertIs(DEFAULT_RATE_LIMITER, HTTPClient().rate_limiter)
+        self.assertIs(DEFAULT_RATE_LIMITER, HTTPClient().rate_limiter)
+        self.assertIs(self.rate_limiter, HTTPClient(self.rate_limiter).rate_limiter)
+
+    @patch("swlwi.net.time.sleep")
+    @patch("swlwi.net.time.monotonic_ns")
+    def test_reserves_slots_per_domain(self, mock_monotonic_ns, mock_sleep):
+        mock_monotonic_ns.return_value = 100_000_000_000
+
+        self.rate_limiter.wait("example.com")
+        self.rate_limiter.wait("other.com")
+        mock_sleep.assert_not_called()
+
+        self.rate_limiter.wait("example.com")
+        mock_sleep.assert_called_once_with(1.0)
+
+        # The next caller queues up behind the slot reserved by the previous one
+        mock_monotonic_ns.return_value = 100_500_000_000
+        self.rate_limiter.wait("example.com")
+        self.assertAlmostEqual(1.5, mock_sleep.call_args[0][0])
+
+    @patch("swlwi.net.asyncio.sleep", new_callable=AsyncMock)
+    @patch("swlwi.net.time.monotonic_ns")
+    def test_wait_async_shares_slots(self, mock_monotonic_ns, mock_sleep):
+        mock_monotonic_ns.return_value = 100_000_000_000
+
+        self.rate_limiter.wait("example.com")
+        asyncio.run(self.rate_limiter.wait_async("example.com"))
+        mock_sleep.assert_awaited_once_with(1.0)
+
+
 # class TestRateLimiter(unittest.TestCase):
 
 #     def setUp(self):
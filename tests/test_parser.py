@@ -81,6 +81,10 @@ Nested *emphasized* content
         result = re.sub(r"(#.*|(?<![-*])\w.*)\n(?!\n)", r"\1\n\n", result)
         self.assertEqual(result.strip(), expected.strip())
 
+    def test_decodes_input_as_utf8(self):
+        html = '<html><head><meta charset="windows-1252"></head><body><p>Café – ok</p></body></html>'
+        self.assertEqual(html_to_markdown(html.encode("utf-8")), "Café – ok")
+
 
 class TestCleanMarkdown(unittest.TestCase):
     def setUp(self):
@@ -103,6 +107,11 @@ class TestCleanMarkdown(unittest.TestCase):
             ("First\n\n\n\nSecond", "First\n\nSecond"),
             # Common separators
             ("Text\n---\nMore text", "Text\nMore text"),
+            # Trailing whitespace
+            ("Line one \t \nLine  two  ", "Line one\nLine  two"),
+            # Empty links unwrapped into filtered lines
+            ("[Follow me]( )\nText", "Text"),
+            ("[[Follow me]( )]( )\nText", "Text"),
         ]
 
         for input_md, expected in test_cases:
@@ -112,6 +121,9 @@ class TestCleanMarkdown(unittest.TestCase):
                 result = re.sub(r"\n{3,}", "\n\n", result)
                 self.assertEqual(result.strip(), expected.strip())
 
+    def test_deeply_nested_empty_links(self):
+        self.assertEqual(clean_markdown("[" * 2000 + "a" + "]()" * 2000), "a")
+
     def test_preserves_valid_content(self):
         valid_markdown = """# Main Title
 
@@ -209,6 +221,21 @@ class TestArticleParsingFunctions(unittest.TestCase):
         total = SiteParser.count_total_articles(sections)
         self.assertEqual(total, 3)
 
+    def test_get_articles_by_section(self):
+        html = """
+        <h3 class="topic-title">Leadership</h3>
+        <div>Article 1</div>
+        <p>Not an article</p>
+        <div>Article 2</div>
+        <h3 class="topic-title">Engineering</h3>
+        <div>Article 3</div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        sections = SiteParser.find_topic_sections(soup)
+        articles_by_section = SiteParser.get_articles_by_section(sections)
+        texts = [[div.get_text() for div in divs] for divs in articles_by_section]
+        self.assertEqual(texts, [["Article 1", "Article 2"], ["Article 3"]])
+
     def test_extract_article(self):
         html = """
         <div>
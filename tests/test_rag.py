@@ -1,18 +1,35 @@
 import os
+import sqlite3
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 from langchain_core.documents import Document
-from swlwi.rag import ListArticles, DocumentLoader, DocumentSplitter
+from swlwi.rag import ListArticles, DocumentLoader, DocumentSplitter, VectorStore
+
+
+def mock_scandir(path, names, is_dir=True):
+    """Mock the context manager returned by os.scandir for the given entry names."""
+    entries = []
+    for name in names:
+        entry = MagicMock()
+        entry.name = name
+        entry.path = os.path.join(path, name)
+        entry.is_dir.return_value = is_dir
+        entries.append(entry)
+    scandir = MagicMock()
+    scandir.__enter__.return_value = iter(entries)
+    return scandir
 
 
 class TestListArticles(unittest.TestCase):
-    @patch("os.listdir")
-    def test_process(self, mock_listdir):
+    @patch("os.scandir")
+    def test_process(self, mock_scandir_call):
         # Mock the directory structure
-        mock_listdir.side_effect = [
-            ["issue-1", "issue-2"],  # First call returns issues
-            ["article-1.md", "article-2.md"],  # Second call returns articles for issue-1
-            ["article-1.md", "article-2.md"],  # Third call returns articles for issue-2
+        mock_scandir_call.side_effect = [
+            mock_scandir("./index", ["issue-1", "issue-2", "README.md"]),  # First call returns issues
+            # Second call returns articles for issue-1
+            mock_scandir(os.path.join("./index", "issue-1"), ["article-1.md", "article-2.md"], is_dir=False),
+            # Third call returns articles for issue-2
+            mock_scandir(os.path.join("./index", "issue-2"), ["article-1.md", "article-2.md", "x.png"], is_dir=False),
         ]
 
         # Create an instance of ListArticles
@@ -158,5 +175,66 @@ Even more text to ensure we have enough content to split into chunks. Chunks are
             self.assertEqual(doc.metadata["summary"], example_metadata["summary"])
 
 
+class TestVectorStore(unittest.TestCase):
+    @patch("swlwi.rag.SQLiteVec")
+    @patch("swlwi.rag.get_embeddings")
+    def test_batches_documents(self, mock_get_embeddings, mock_sqlite_vec):
+        vector_store = VectorStore(id="Vector Store")
+        vector_store.batch_size = 3
+        store = mock_sqlite_vec.return_value
+
+        def docs(name, count):
+            return [Document(page_content=f"{name} {i}", metadata={"path": name}) for i in range(count)]
+
+        first, second, third = docs("a", 2), docs("b", 2), docs("c", 1)
+        with patch("os.makedirs"):
+            vector_store.process(first, "./index/vectors")
+            store.add_documents.assert_not_called()
+
+            vector_store.process(second, "./index/vectors")
+            store.add_documents.assert_called_once_with(first + second)
+
+            vector_store.process(third, "./index/vectors")
+        vector_store.finish()
+
+        self.assertEqual(store.add_documents.call_count, 2)
+        store.add_documents.assert_called_with(third)
+        mock_get_embeddings.assert_called_once()
+        connection = mock_sqlite_vec.create_connection.return_value
+        self.assertIn("journal_mode=WAL", connection.executescript.call_args[0][0])
+        self.assertIs(mock_sqlite_vec.call_args.kwargs["connection"], connection)
+
+    @patch("swlwi.rag.SQLiteVec")
+    @patch("swlwi.rag.get_embeddings")
+    def test_duplicates_only_skip_their_article(self, mock_get_embeddings, mock_sqlite_vec):
+        vector_store = VectorStore(id="Vector Store")
+        store = mock_sqlite_vec.return_value
+        duplicate = sqlite3.OperationalError("UNIQUE constraint failed: swlwi_embeddings_vec.rowid")
+        documents = [Document(page_content=f"{path} {i}", metadata={"path": path}) for path in "abc" for i in range(2)]
+        store.add_documents.side_effect = [duplicate, None, duplicate, None]
+
+        with patch("os.makedirs"):
+            vector_store.process(documents, "./index/vectors")
+        vector_store.finish()
+
+        calls = [call.args[0] for call in store.add_documents.call_args_list]
+        self.assertEqual([documents, documents[:2], documents[2:4], documents[4:]], calls)
+        self.assertEqual(2, mock_sqlite_vec.create_connection.return_value.rollback.call_count)
+        self.assertEqual([], vector_store._buffer)
+
+    @patch("swlwi.rag.SQLiteVec")
+    @patch("swlwi.rag.get_embeddings")
+    def test_keeps_batch_on_other_errors(self, mock_get_embeddings, mock_sqlite_vec):
+        vector_store = VectorStore(id="Vector Store")
+        vector_store.batch_size = 1
+        mock_sqlite_vec.return_value.add_documents.side_effect = sqlite3.OperationalError("database is locked")
+        documents = [Document(page_content="a", metadata={"path": "a"})]
+
+        with patch("os.makedirs"), self.assertRaises(sqlite3.OperationalError):
+            vector_store.process(documents, "./index/vectors")
+
+        self.assertEqual(documents, vector_store._buffer)
+
+
 if __name__ == "__main__":
     unittest.main()
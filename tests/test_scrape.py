@@ -7,6 +7,7 @@ from swlwi.scrape import (
     ExtractArticleContent,
     ExtractArticles,
     FetchArticle,
+    FetchArticleWithJavaScript,
     Issue,
     ListIssues,
     SaveArticle,
@@ -15,7 +16,7 @@ from swlwi.scrape import (
 
 
 class TestListIssues(unittest.TestCase):
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_process(self, mock_get):
         # Mock the HTML content
         html_content = """
@@ -126,7 +127,7 @@ class TestSkipExistingIssues(unittest.TestCase):
 
 
 class TestExtractArticles(unittest.TestCase):
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_process(self, mock_get):
         # Example HTML content
         example_html = """
@@ -236,8 +237,9 @@ class TestExtractArticles(unittest.TestCase):
         # Create a mock Issue object
         mock_issue = Issue(num=613, url="http://example.com", date=date(2024, 8, 23), item_of=(0, 1))
 
-        # Call the process method with the mock Issue
+        # Call the process method with the mock Issue and wait for it to be extracted
         extract_articles.process(mock_issue)
+        extract_articles.finish()
 
         # Check that the send method was called the correct number of times
         self.assertEqual(8, extract_articles.send.call_count)
@@ -347,8 +349,8 @@ class TestFetchArticle(unittest.TestCase):
         # Create a mock Article object
         mock_article = Article(title="Some Article", url="http://example.com")
 
-        # Call the process method with the mock Article
-        actual = fetch_article.process(mock_article)
+        # Call the fetch method with the mock Article
+        actual = fetch_article.fetch(mock_article)
 
         article = actual.get("complete")
 
@@ -382,8 +384,8 @@ class TestFetchArticle(unittest.TestCase):
         # Create a mock Article object
         mock_article = Article(title="Some Article", url="http://example.com")
 
-        # Call the process method with the mock Article
-        result = fetch_article.process(mock_article)
+        # Call the fetch method with the mock Article
+        result = fetch_article.fetch(mock_article)
 
         need_js = result.get("needs_javascript")
         complete = result.get("complete")
@@ -394,6 +396,64 @@ class TestFetchArticle(unittest.TestCase):
 
         self.assertEqual(mock_article, need_js)
 
+    def test_process_sends_fetched_articles_before_finishing(self):
+        fetch_article = FetchArticle(id="Fetch Article")
+        articles = [Article(title=f"Article {i}", url=f"http://example{i}.com") for i in range(3)]
+        fetch_article.fetch = MagicMock(side_effect=lambda article: {"complete": article})
+        for output in fetch_article.outputs.values():
+            output.connect(MagicMock())
+        fetch_article.send = MagicMock()
+
+        for article in articles:
+            fetch_article.process(article)
+        fetch_article.finish()
+
+        sent = [call.args for call in fetch_article.send.call_args_list]
+        self.assertCountEqual([("complete", article) for article in articles], sent)
+
+    def test_rate_limited_articles_dont_hold_workers(self):
+        fetch_article = FetchArticle(id="Fetch Article")
+        fetch_article.http_client.rate_limiter = MagicMock()
+        # The second article to example.com has to wait for its slot, the other domain goes first
+        fetch_article.http_client.rate_limiter.reserve.side_effect = [0.0, 0.2, 0.0]
+        fetched = []
+        fetch_article.fetch = MagicMock(side_effect=lambda article: fetched.append(article.url) or {})
+        urls = ["http://example.com/1", "http://example.com/2", "http://other.com/1"]
+
+        for url in urls:
+            fetch_article.process(Article(title=url, url=url))
+        fetch_article.finish()
+
+        self.assertCountEqual(urls, fetched)
+        self.assertEqual("http://example.com/2", fetched[-1])
+
+
+class TestFetchArticleWithJavaScript(unittest.TestCase):
+    @patch("swlwi.scrape.BrowserClient")
+    def test_articles_are_fetched_in_batches(self, mock_browser_client_class):
+        browser_client = mock_browser_client_class.return_value
+        browser_client.fetch_many.side_effect = lambda urls, timeout: [
+            None if "broken" in url else url.encode() for url in urls
+        ]
+        fetch_article = FetchArticleWithJavaScript(id="Fetch Article With JavaScript")
+        fetch_article.batch_size = 2
+        fetch_article.outputs["article"].connect(MagicMock())
+        fetch_article.send = MagicMock()
+        urls = ["http://example1.com", "http://broken.example.com", "http://example3.com"]
+        articles = [Article(title=f"Article {i}", url=url) for i, url in enumerate(urls)]
+
+        for article in articles:
+            fetch_article.process(article)
+        self.assertEqual(1, browser_client.fetch_many.call_count)
+        fetch_article.finish()
+
+        self.assertEqual([call.args[0] for call in browser_client.fetch_many.call_args_list], [urls[:2], urls[2:]])
+        self.assertEqual(
+            [("article", article) for article in articles], [c.args for c in fetch_article.send.call_args_list]
+        )
+        self.assertEqual([b"http://example1.com", b"", b"http://example3.com"], [a.html for a in articles])
+        browser_client.close.assert_called_once()
+
 
 class TestExtractArticleContent(unittest.TestCase):
     def test_extract_article_content(self):
@@ -420,6 +480,7 @@ Some more text"""
 
         self.assertIsInstance(article, Article)
         self.assertEqual(expected_markdown, article.markdown)
+        self.assertEqual(b"", article.html)
 
 
 class TestSaveArticle(unittest.TestCase):
@@ -459,6 +520,18 @@ Article summary
         mock_open.assert_called_once_with(expected_path, "w", encoding="utf-8")
         mock_open().write.assert_called_once_with(expected_header + "Some text")
 
+    @patch("builtins.open", new_callable=mock_open)
+    @patch("os.makedirs")
+    def test_issue_directory_is_created_once(self, mock_makedirs, mock_open):
+        save_article = SaveArticle(id="Save Article")
+
+        for i in range(3):
+            article = Article(title=f"Article {i}", url="http://example.com", issue_num=1, item_of=(i, 3))
+            save_article.process(article=article, path="/tmp/articles")
+
+        mock_makedirs.assert_called_once_with("/tmp/articles/issue-1", exist_ok=True)
+        self.assertEqual(3, mock_open.call_count)
+
 
 if __name__ == "__main__":
     unittest.main()